@@ -0,0 +1,26 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of calibration lines, 1000 per unit."""
+    rng = random.Random(seed)
+
+    for _ in range(scaled(1000, scale)):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            match rng.random():
+                case r if r < 0.3:
+                    pieces.append(str(rng.randint(1, 9)))
+                case r if r < 0.6:
+                    pieces.append(rng.choice(WORDS))
+                case _:
+                    pieces.append("".join(rng.choices(LETTERS, k=rng.randint(1, 5))))
+
+        rng.shuffle(pieces)
+        yield "".join(pieces)
@@ -1,14 +1,28 @@
+from typing import Optional
+
+from util import parallel_sum, sum_digit_lines
+
+
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
         return f.readlines()
 
 
-total = 0
-lines = read_file("data/input")
-for line in lines:
-    a = next(x for x in line if x.isnumeric())
-    b = next(x for x in reversed(line) if x.isnumeric())
-    value: str = a + b
-    total += int(value)
+def run(path: str = "data/input") -> int:
+    total = 0
+    lines = read_file(path)
+    for line in lines:
+        a = next(x for x in line if x.isnumeric())
+        b = next(x for x in reversed(line) if x.isnumeric())
+        value: str = a + b
+        total += int(value)
+
+    return total
+
+
+def run_parallel(path: str = "data/input", workers: Optional[int] = None) -> int:
+    return parallel_sum(path, sum_digit_lines, workers)
+
 
-print(total)
+if __name__ == "__main__":
+    print(run())
@@ -1,46 +1,28 @@
+from typing import Optional
+
+from util import find_first_match, parallel_sum, sum_spelled_lines
+
+
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
         return f.readlines()
 
 
-tokens = {
-    "one": "1",
-    "two": "2",
-    "three": "3",
-    "four": "4",
-    "five": "5",
-    "six": "6",
-    "seven": "7",
-    "eight": "8",
-    "nine": "9",
-}
-token_lengths = set([len(x) for x in tokens])
-
-
-def find_first_match(value: str, reverse: bool = False):
-    if reverse:
-        value = value[::-1]
-
-    i = 0
-    while i < len(value):
-        c = value[i]
-        if c.isnumeric():
-            return c
-        else:
-            for token_length in token_lengths:
-                s = value[i : i + token_length]
-                token_candidate = s if not reverse else s[::-1]
-                if token_candidate in tokens:
-                    return tokens[token_candidate]
-        i += 1
-
-
-total = 0
-lines = read_file("data/input")
-for line in lines:
-    line = line.strip()
-    a = find_first_match(line)
-    b = find_first_match(line, reverse=True) or a
-    total += int(a + b)
-
-print(total)
+def run(path: str = "data/input") -> int:
+    total = 0
+    lines = read_file(path)
+    for line in lines:
+        line = line.strip()
+        a = find_first_match(line)
+        b = find_first_match(line, reverse=True) or a
+        total += int(a + b)
+
+    return total
+
+
+def run_parallel(path: str = "data/input", workers: Optional[int] = None) -> int:
+    return parallel_sum(path, sum_spelled_lines, workers)
+
+
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,157 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Optional
+
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# The line sums run in pool workers, which import them from here by name (the part modules are loaded under
+# other names by the bench).
+NON_DIGITS = bytes(c for c in range(256) if not (ord("0") <= c <= ord("9") or c == ord("\n")))
+
+
+def chunk_bounds(path: str, chunk_size: int) -> list[tuple[int, int]]:
+    # Byte ranges of about chunk_size each, moved forward so that every range ends on a newline.
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = []
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", min(start + chunk_size, size))
+                end = size if end == -1 else end + 1
+                bounds.append((start, end))
+                start = end
+
+    return bounds
+
+
+def read_chunk(path: str, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[start:end]
+
+
+def sum_chunk(sum_lines: Callable[[bytes], int], path: str, bounds: tuple[int, int]) -> int:
+    return sum_lines(read_chunk(path, *bounds))
+
+
+def parallel_sum(
+    path: str, sum_lines: Callable[[bytes], int], workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """
+    Sum sum_lines over newline-aligned chunks of the file, one chunk per task in a process pool.
+
+    Workers map the file themselves, so only the chunk offsets and the partial sums cross process boundaries and
+    memory use stays at about one chunk per worker, whatever the size of the file.
+    """
+    bounds = chunk_bounds(path, chunk_size)
+    if len(bounds) <= 1 or workers == 1:
+        return sum(sum_chunk(sum_lines, path, b) for b in bounds)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(partial(sum_chunk, sum_lines, path), bounds))
+
+
+tokens = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+}
+
+
+class DigitScanner:
+    """
+    Aho-Corasick automaton over a set of patterns, with the failure links folded into the transitions.
+
+    Scanning walks the characters once and never slices the input.
+    """
+
+    transitions: list[dict[str, int]]
+    outputs: list[Optional[str]]
+
+    def __init__(self, patterns: dict[str, str]):
+        self.transitions = [{}]
+        self.outputs = [None]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for c in pattern:
+                if c not in self.transitions[state]:
+                    self.transitions[state][c] = len(self.transitions)
+                    self.transitions.append({})
+                    self.outputs.append(None)
+                state = self.transitions[state][c]
+
+            self.outputs[state] = value
+
+        alphabet = set("".join(patterns))
+        fail = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            if self.outputs[state] is None:
+                self.outputs[state] = self.outputs[fail[state]]
+
+            for c in alphabet:
+                fallback = self.transitions[fail[state]].get(c, 0)
+                if (child := self.transitions[state].get(c)) is not None:
+                    fail[child] = fallback
+                    queue.append(child)
+                else:
+                    self.transitions[state][c] = fallback
+
+    def scan(self, chars: Iterable[str]) -> Optional[str]:
+        transitions = self.transitions
+        outputs = self.outputs
+
+        state = 0
+        for c in chars:
+            state = transitions[state].get(c, 0)
+            if (value := outputs[state]) is not None:
+                return value
+
+        return None
+
+
+# No token is part of another, so the first match to end is also the first to start.
+digits = {str(x): str(x) for x in range(1, 10)}
+forward_scanner = DigitScanner(tokens | digits)
+backward_scanner = DigitScanner({token[::-1]: value for token, value in tokens.items()} | digits)
+
+
+def find_first_match(value: str, reverse: bool = False):
+    if reverse:
+        return backward_scanner.scan(reversed(value))
+
+    return forward_scanner.scan(value)
+
+
+def sum_digit_lines(chunk: bytes) -> int:
+    total = 0
+    for digits in chunk.translate(None, NON_DIGITS).split(b"\n"):
+        if digits:
+            total += 10 * (digits[0] - ord("0")) + digits[-1] - ord("0")
+
+    return total
+
+
+def sum_spelled_lines(chunk: bytes) -> int:
+    total = 0
+    for line in chunk.decode().splitlines():
+        if a := find_first_match(line):
+            b = find_first_match(line, reverse=True)
+            total += int(a + b)
+
+    return total
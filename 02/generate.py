@@ -0,0 +1,19 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+COLORS = ["red", "green", "blue"]
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of games, 100 per unit."""
+    rng = random.Random(seed)
+
+    for game_id in range(1, scaled(100, scale) + 1):
+        subsets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            subsets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+
+        yield f"Game {game_id}: {'; '.join(subsets)}"
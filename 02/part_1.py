@@ -1,3 +1,9 @@
+import numpy as np
+
+from stream import final_totals
+from util import COLORS, load_columns, max_per_game
+
+
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
         return f.readlines()
@@ -20,6 +26,27 @@ def parse_game(gameData: str):
     return id
 
 
-lines = read_file("data/input")
-result = [game_id for game_id in map(parse_game, lines) if game_id is not None]
-print(sum(result))
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    result = [game_id for game_id in map(parse_game, lines) if game_id is not None]
+    return sum(result)
+
+
+def run_columnar(path: str = "data/input") -> int:
+    columns = load_columns(path)
+    required = max_per_game(columns)
+
+    limits = [cube_counts[color] for color in COLORS]
+    possible = (required <= limits).all(axis=1)
+
+    game_ids = np.zeros(columns.n_games, dtype=np.int64)
+    game_ids[columns.game_row] = columns.game_id
+    return int(game_ids[possible].sum())
+
+
+def run_streaming(path: str = "data/input") -> int:
+    return final_totals(path)[0]
+
+
+if __name__ == "__main__":
+    print(run())
@@ -1,5 +1,8 @@
 import numpy as np
 
+from stream import final_totals
+from util import load_columns, max_per_game
+
 
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
@@ -20,6 +23,23 @@ def parse_game(gameData: str):
     return np.prod(list(required.values()))
 
 
-lines = read_file("data/input")
-result = [game_id for game_id in map(parse_game, lines) if game_id is not None]
-print(sum(result))
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    result = [game_id for game_id in map(parse_game, lines) if game_id is not None]
+    return sum(result)
+
+
+def run_columnar(path: str = "data/input") -> int:
+    required = max_per_game(load_columns(path))
+
+    # Colors a game never shows don't count towards its power.
+    required[required == 0] = 1
+    return int(required.prod(axis=1).sum())
+
+
+def run_streaming(path: str = "data/input") -> int:
+    return final_totals(path)[1]
+
+
+if __name__ == "__main__":
+    print(run())
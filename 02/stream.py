@@ -0,0 +1,93 @@
+import argparse
+import sys
+import time
+from typing import Iterable, Iterator, TextIO
+
+cube_counts = {"red": 12, "green": 13, "blue": 14}
+
+
+def read_records(source: TextIO, follow: bool = False, poll_interval: float = 0.5) -> Iterator[str]:
+    """
+    Yield one game record at a time. With follow, wait for more records at the end of the file instead of stopping,
+    like tail -f.
+    """
+    pending = ""
+    while True:
+        line = source.readline()
+        if line == "":
+            if not follow:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        # A writer may be in the middle of a record, only hand out complete lines while following.
+        pending += line
+        if follow and not pending.endswith("\n"):
+            continue
+
+        if record := pending.strip():
+            yield record
+        pending = ""
+
+    if record := pending.strip():
+        yield record
+
+
+def parse_record(record: str) -> tuple[int, dict[str, int]]:
+    info, data = record.split(":")
+    game_id = int(info.split()[1])
+
+    required: dict[str, int] = {}
+    for subset in data.split(";"):
+        for cube_data in subset.split(","):
+            count, color = cube_data.split()
+            required[color] = max(required.get(color, 0), int(count))
+
+    return game_id, required
+
+
+def running_totals(records: Iterable[str]) -> Iterator[tuple[int, int]]:
+    # (sum of possible game ids, sum of game powers) after every record.
+    possible_total = 0
+    power_total = 0
+    for record in records:
+        game_id, required = parse_record(record)
+
+        if all(count <= cube_counts[color] for color, count in required.items()):
+            possible_total += game_id
+
+        power = 1
+        for count in required.values():
+            power *= count
+        power_total += power
+
+        yield possible_total, power_total
+
+
+def final_totals(path: str) -> tuple[int, int]:
+    totals = (0, 0)
+    with open(path, "r") as f:
+        for totals in running_totals(read_records(f)):
+            pass
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Running day 02 totals over a game log.")
+    parser.add_argument("path", nargs="?", default="-", help="game log, - for stdin")
+    parser.add_argument("-f", "--follow", action="store_true", help="keep reading as the log grows")
+    args = parser.parse_args()
+
+    totals = (0, 0)
+    source = sys.stdin if args.path == "-" else open(args.path, "r")
+    with source:
+        for totals in running_totals(read_records(source, args.follow)):
+            if args.follow:
+                print(*totals, flush=True)
+
+    print(*totals)
+
+
+if __name__ == "__main__":
+    main()
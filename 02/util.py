@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+COLORS = ["red", "green", "blue"]
+
+
+@dataclass
+class GameColumns:
+    """One row per "<count> <color>" entry of the log."""
+
+    game_id: np.ndarray
+    game_row: np.ndarray
+    draw: np.ndarray
+    color: np.ndarray
+    count: np.ndarray
+
+    n_games: int
+
+
+def load_columns(path: str) -> GameColumns:
+    with open(path, "rb") as f:
+        data = np.frombuffer(f.read(), dtype=np.uint8)
+
+    # Every number in the file is a run of digits. Evaluate all runs at once: each digit contributes
+    # digit * 10^(digits left in its run).
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    lengths = ends - starts
+    digit_pos = np.flatnonzero(is_digit)
+    powers = 10 ** (np.repeat(ends, lengths) - digit_pos - 1)
+    digits = (data[digit_pos] - ord("0")).astype(np.int64) * powers
+    values = np.add.reduceat(digits, np.cumsum(lengths) - lengths)
+
+    # "Game <id>:" numbers are followed by a colon, "<count> <color>" numbers by a space and the color.
+    following = data[np.minimum(ends, len(data) - 1)]
+    is_header = following == ord(":")
+    header_pos = starts[is_header]
+
+    entries = ~is_header
+    entry_pos = starts[entries]
+    color_char = data[ends[entries] + 1]
+    color = np.select([color_char == ord("r"), color_char == ord("g")], [0, 1], 2).astype(np.int8)
+
+    game_row = np.searchsorted(header_pos, entry_pos, side="right") - 1
+
+    # Draws are separated by ";", count them since the start of the game.
+    semicolons = np.cumsum(data == ord(";"))
+    draw = semicolons[entry_pos] - semicolons[header_pos][game_row]
+
+    return GameColumns(
+        game_id=values[is_header][game_row],
+        game_row=game_row,
+        draw=draw,
+        color=color,
+        count=values[entries],
+        n_games=len(header_pos),
+    )
+
+
+def max_per_game(columns: GameColumns) -> np.ndarray:
+    # (n_games, 3) array with the largest count of every color seen in each game.
+    required = np.zeros((columns.n_games, len(COLORS)), dtype=np.int64)
+    np.maximum.at(required, (columns.game_row, columns.color), columns.count)
+
+    return required
@@ -0,0 +1,25 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled_side
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of cells, a 140 x 140 schematic per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(140, scale)
+
+    for _ in range(side):
+        row = ""
+        while len(row) < side:
+            match rng.random():
+                case r if r < 0.06:
+                    row += str(rng.randint(1, 999)) + "."
+                case r if r < 0.09:
+                    row += rng.choice(SYMBOLS)
+                case _:
+                    row += "."
+
+        yield row[:side]
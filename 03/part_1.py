@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional
+
+from util import label_numbers, load_grid, part_number_labels, part_number_sum, tiled_sum
 
 
 def read_file(path: str) -> str:
@@ -6,9 +9,6 @@ def read_file(path: str) -> str:
         return f.readlines()
 
 
-rows = [line.strip() for line in read_file("data/input")]
-
-
 @dataclass
 class MapNumber:
     value: int
@@ -28,7 +28,7 @@ class Map:
         self.height = len(rows)
 
     def get_char(self, x: int, y: int) -> str:
-        i = y * self.height + x
+        i = y * self.width + x
         return self.data[i]
 
     def is_symbol(self, x: int, y: int) -> bool:
@@ -80,19 +80,37 @@ class Map:
         return MapNumber(int(digits), x0, x - 1, y)
 
 
-m = Map(rows)
-total = 0
+def run(path: str = "data/input") -> int:
+    rows = [line.strip() for line in read_file(path)]
+
+    m = Map(rows)
+    total = 0
+
+    for y in range(m.height):
+        x = 0
+        while x < m.width:
+            if m.is_numeric(x, y):
+                map_number = m.get_number(x, y)
+                x = map_number.x1
+
+                if m.has_adjacent_symbol(map_number):
+                    total += map_number.value
+
+            x += 1
+
+    return total
+
+
+def run_vectorized(path: str = "data/input") -> int:
+    grid = load_grid(path)
+    numbers = label_numbers(grid)
+
+    return int(numbers.values[part_number_labels(grid, numbers) - 1].sum())
 
-for y in range(m.height):
-    x = 0
-    while x < m.width:
-        if m.is_numeric(x, y):
-            map_number = m.get_number(x, y)
-            x = map_number.x1
 
-            if m.has_adjacent_symbol(map_number):
-                total += map_number.value
+def run_tiled(path: str = "data/input", band_rows: Optional[int] = None, workers: Optional[int] = None) -> int:
+    return tiled_sum(path, part_number_sum, band_rows, workers)
 
-        x += 1
 
-print(total)
+if __name__ == "__main__":
+    print(run())
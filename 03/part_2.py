@@ -1,15 +1,16 @@
 from dataclasses import dataclass
+from typing import Optional
+
 import numpy as np
 
+from util import gear_ratio_sum, gear_ratios, label_numbers, load_grid, tiled_sum
+
 
 def read_file(path: str) -> str:
     with open(path, "r") as f:
         return f.readlines()
 
 
-rows = [line.strip() for line in read_file("data/input")]
-
-
 @dataclass
 class MapNumber:
     value: int
@@ -29,7 +30,7 @@ class Map:
         self.height = len(rows)
 
     def get_char(self, x: int, y: int) -> str:
-        i = y * self.height + x
+        i = y * self.width + x
         return self.data[i]
 
     def is_symbol(self, x: int, y: int) -> bool:
@@ -81,27 +82,68 @@ class Map:
         return MapNumber(int(digits), x0, x - 1, y)
 
 
-m = Map(rows)
+class GearIndex:
+    """
+    Count and product of the numbers next to every cell, keyed on the flat cell index y * width + x.
+
+    A cell touches at most 6 numbers, and only the product of cells with exactly two is used, so a byte per count
+    and an int64 per product are enough, like the int64 ratios of gear_ratios.
+    """
+
+    width: int
+    counts: np.ndarray
+    products: np.ndarray
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.counts = np.zeros(width * height, dtype=np.uint8)
+        self.products = np.ones(width * height, dtype=np.int64)
+
+    def add(self, x: int, y: int, value: int):
+        i = y * self.width + x
+        self.counts[i] += 1
+        if self.counts[i] <= 2:
+            self.products[i] *= value
+
+    def total_ratio(self) -> int:
+        return int(self.products[self.counts == 2].sum())
+
+
+def run(path: str = "data/input") -> int:
+    rows = [line.strip() for line in read_file(path)]
+
+    m = Map(rows)
+
+    gears = GearIndex(m.width, m.height)
+
+    for y in range(m.height):
+        x = 0
+        while x < m.width:
+            if m.is_numeric(x, y):
+                map_number = m.get_number(x, y)
+
+                for gear_x, gear_y in m.get_adjacent_symbol_positions(map_number):
+                    # Only '*' is a gear, as in gear_ratios. This used to count any symbol next to two numbers.
+                    if m.get_char(gear_x, gear_y) == "*":
+                        gears.add(gear_x, gear_y, map_number.value)
+
+                # Move cursor to the end of the number
+                x = map_number.x1
+
+            x += 1
+
+    return gears.total_ratio()
 
-# "X_Y" -> list of map number values
-potential_gears: dict[str, list[int]] = {}
 
-for y in range(m.height):
-    x = 0
-    while x < m.width:
-        if m.is_numeric(x, y):
-            map_number = m.get_number(x, y)
+def run_vectorized(path: str = "data/input") -> int:
+    grid = load_grid(path)
 
-            for gear_x, gear_y in m.get_adjacent_symbol_positions(map_number):
-                key = f"{gear_x}_{gear_y}"
-                potential_gears.setdefault(key, []).append(map_number.value)
+    return int(gear_ratios(grid, label_numbers(grid)).sum())
 
-            # Move cursor to the end of the number
-            x = map_number.x1
 
-        x += 1
+def run_tiled(path: str = "data/input", band_rows: Optional[int] = None, workers: Optional[int] = None) -> int:
+    return tiled_sum(path, gear_ratio_sum, band_rows, workers)
 
-gears = [xs for xs in potential_gears.values() if len(xs) == 2]
-result = sum([np.prod(xs) for xs in gears])
 
-print(result)
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,25 @@
+import os
+import tempfile
+
+import part_1
+import part_2
+
+# Checks run_tiled against run_vectorized on the example with the different ways a file can end.
+with open("data/example", "r") as f:
+    rows = f.read().strip().split("\n")
+
+endings = ["", "\n", "\n\n", "\n\n\n", "\r\n"]
+for n_rows in range(1, len(rows) + 1):
+    for ending in endings:
+        separator = "\r\n" if ending == "\r\n" else "\n"
+        with tempfile.NamedTemporaryFile("w", newline="", delete=False) as f:
+            f.write(separator.join(rows[:n_rows]) + ending)
+
+        for part in (part_1, part_2):
+            for band_rows in (1, 2, None):
+                expected = part.run_vectorized(f.name)
+                assert part.run_tiled(f.name, band_rows, workers=1) == expected, (n_rows, repr(ending), band_rows)
+
+        os.remove(f.name)
+
+print("ok")
@@ -0,0 +1,179 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Optional
+
+import numpy as np
+
+EMPTY = ord(".")
+GEAR = ord("*")
+
+
+def load_grid(path: str) -> np.ndarray:
+    with open(path, "rb") as f:
+        rows = [row.strip() for row in f.read().split(b"\n") if row.strip()]
+
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), len(rows[0]))
+
+
+def is_digit(grid: np.ndarray) -> np.ndarray:
+    return (grid >= ord("0")) & (grid <= ord("9"))
+
+
+def is_symbol(grid: np.ndarray) -> np.ndarray:
+    return ~is_digit(grid) & (grid != EMPTY)
+
+
+def dilate(mask: np.ndarray) -> np.ndarray:
+    # Grow the mask by one cell in all 8 directions (a 3x3 kernel).
+    h, w = mask.shape
+    padded = np.pad(mask, 1)
+
+    result = np.zeros_like(mask)
+    for dy in range(3):
+        for dx in range(3):
+            result |= padded[dy : dy + h, dx : dx + w]
+
+    return result
+
+
+@dataclass
+class Numbers:
+    # labels[y, x] is 1 + the index of the number covering the cell, 0 where there is no number.
+    labels: np.ndarray
+    values: np.ndarray
+
+
+def label_numbers(grid: np.ndarray) -> Numbers:
+    """
+    Label every horizontal run of digits as one number, with its value.
+    """
+    h, w = grid.shape
+
+    # A column of padding keeps runs from wrapping onto the next row in the flattened grid.
+    digits = np.pad(is_digit(grid), ((0, 0), (0, 1))).ravel()
+    edges = np.diff(digits.astype(np.int8), prepend=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+
+    digit_pos = np.flatnonzero(digits)
+    cells = np.pad(grid, ((0, 0), (0, 1))).ravel()
+    powers = 10 ** (np.repeat(ends, lengths) - digit_pos - 1)
+    contributions = (cells[digit_pos] - ord("0")).astype(np.int64) * powers
+    values = np.add.reduceat(contributions, np.cumsum(lengths) - lengths) if len(starts) else np.zeros(0, np.int64)
+
+    labels = np.zeros(h * (w + 1), dtype=np.int64)
+    labels[digit_pos] = np.repeat(np.arange(1, len(starts) + 1), lengths)
+
+    return Numbers(labels=labels.reshape(h, w + 1)[:, :w], values=values)
+
+
+def part_number_labels(grid: np.ndarray, numbers: Numbers, rows: slice = slice(None)) -> np.ndarray:
+    # Labels of the numbers on the given rows with a digit next to a symbol.
+    touching = dilate(is_symbol(grid)) & (numbers.labels > 0)
+    return np.unique(numbers.labels[rows][touching[rows]])
+
+
+def neighbor_labels(numbers: Numbers, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    # (len(ys), 8) labels of the cells around each (y, x), 0 outside the grid.
+    labels = np.pad(numbers.labels, 1)
+    offsets = [(dy, dx) for dy in range(3) for dx in range(3) if (dy, dx) != (1, 1)]
+
+    return np.stack([labels[ys + dy, xs + dx] for dy, dx in offsets], axis=1)
+
+
+def gear_ratios(grid: np.ndarray, numbers: Numbers, rows: slice = slice(None), gear_symbol: int = GEAR) -> np.ndarray:
+    # Ratios of the gears on the given rows.
+    gears = np.zeros(grid.shape, dtype=bool)
+    gears[rows] = grid[rows] == gear_symbol
+    ys, xs = np.nonzero(gears)
+    around = np.sort(neighbor_labels(numbers, ys, xs), axis=1)
+
+    # Count each number once per gear, however many of its digits touch it.
+    distinct = (around > 0) & (np.diff(around, axis=1, prepend=0) != 0)
+    gears = distinct.sum(axis=1) == 2
+
+    pairs = around[gears][distinct[gears]].reshape(-1, 2)
+    return numbers.values[pairs[:, 0] - 1] * numbers.values[pairs[:, 1] - 1]
+
+
+def part_number_sum(grid: np.ndarray, rows: slice = slice(None)) -> int:
+    numbers = label_numbers(grid)
+    return int(numbers.values[part_number_labels(grid, numbers, rows) - 1].sum())
+
+
+def gear_ratio_sum(grid: np.ndarray, rows: slice = slice(None)) -> int:
+    return int(gear_ratios(grid, label_numbers(grid), rows).sum())
+
+
+@dataclass
+class Layout:
+    # Every row takes stride bytes in the file: width cells and the line break.
+    width: int
+    stride: int
+    height: int
+
+
+def file_layout(path: str) -> Layout:
+    with open(path, "rb") as f:
+        first_row = f.readline()
+        size = os.fstat(f.fileno()).st_size
+
+        # A final line break or trailing blank lines are not rows.
+        if size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while size > 0 and mm[size - 1] in b"\r\n":
+                    size -= 1
+
+    width = len(first_row.rstrip(b"\r\n"))
+    stride = len(first_row)
+
+    return Layout(width=width, stride=stride, height=-(-size // stride))
+
+
+def read_rows(path: str, layout: Layout, first: int, last: int) -> np.ndarray:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[first * layout.stride : last * layout.stride]
+
+    # The last row of the file may have no line break, pad it with empty cells.
+    data = data.ljust((last - first) * layout.stride, b".")
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(last - first, layout.stride)
+
+    return rows[:, : layout.width]
+
+
+def band_sum(band_fn: Callable[[np.ndarray, slice], int], path: str, layout: Layout, band: tuple[int, int]) -> int:
+    first, last = band
+
+    # Read one extra row on each side, so numbers and gears on the band's edges see all their neighbours.
+    # Only what lies on the band's own rows is counted, so nothing is counted twice.
+    halo_first, halo_last = max(first - 1, 0), min(last + 1, layout.height)
+    grid = read_rows(path, layout, halo_first, halo_last)
+
+    return band_fn(grid, slice(first - halo_first, last - halo_first))
+
+
+def tiled_sum(
+    path: str,
+    band_fn: Callable[[np.ndarray, slice], int],
+    band_rows: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Sum band_fn over horizontal bands of the schematic, without ever loading all of it.
+
+    Bands default to about 16M cells each and are spread over a process pool.
+    """
+    layout = file_layout(path)
+    band_rows = band_rows or max(1, 16 * 1024 * 1024 // max(layout.width, 1))
+    bands = [(first, min(first + band_rows, layout.height)) for first in range(0, layout.height, band_rows)]
+
+    if len(bands) <= 1 or workers == 1:
+        return sum(band_sum(band_fn, path, layout, band) for band in bands)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(partial(band_sum, band_fn, path, layout), bands))
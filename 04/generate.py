@@ -0,0 +1,29 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of cards, 200 per unit."""
+    rng = random.Random(seed)
+    n_cards = scaled(200, scale)
+    width = len(str(n_cards))
+
+    # Cards are dealt in runs where no card wins copies past the end of its run, like the puzzle input.
+    # That keeps the part 2 copy counts bounded and never wins cards past the end of the deck.
+    card_id = 1
+    while card_id <= n_cards:
+        run_length = min(rng.randint(5, 15), n_cards - card_id + 1)
+        for i in range(run_length):
+            win_count = rng.randint(0, min(10, run_length - i - 1))
+            key_numbers = rng.sample(range(1, 100), 10)
+            numbers = rng.sample(key_numbers, win_count) + rng.sample(
+                [x for x in range(1, 100) if x not in key_numbers], 25 - win_count
+            )
+            rng.shuffle(numbers)
+
+            key_str = " ".join(f"{x:>2}" for x in key_numbers)
+            numbers_str = " ".join(f"{x:>2}" for x in numbers)
+            yield f"Card {card_id:>{width}}: {key_str} | {numbers_str}"
+            card_id += 1
@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 
+import numpy as np
+
+from util import batch_win_counts, load_deck, win_counts
+
 
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
@@ -29,8 +33,24 @@ def score(card: Card) -> int:
     return 0 if win_count == 0 else pow(2, win_count - 1)
 
 
-lines = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+
+    cards = [Card.from_str(line) for line in lines]
+    scores = [score(card) for card in cards]
+    return sum(scores)
+
+
+def run_bitset(path: str = "data/input") -> int:
+    return sum(1 << (k - 1) for k in win_counts(read_file(path)) if k > 0)
+
+
+def run_numpy(path: str = "data/input") -> int:
+    counts = batch_win_counts(*load_deck(read_file(path)))
+    scores = np.where(counts > 0, 2 ** np.maximum(counts - 1, 0), 0)
+
+    return int(scores.sum())
+
 
-cards = [Card.from_str(line) for line in lines]
-scores = [score(card) for card in cards]
-print(sum(scores))
+if __name__ == "__main__":
+    print(run())
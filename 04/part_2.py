@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-import time
+
+from util import batch_win_counts, load_deck, win_counts
 
 
 def read_file(path: str) -> list[str]:
@@ -23,21 +24,48 @@ class Card:
         return cls(key_numbers, numbers)
 
 
-lines = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+
+    cards = [Card.from_str(line) for line in lines]
+    card_counts = dict.fromkeys(range(len(cards)), 1)
+
+    for i, card in enumerate(cards):
+        wins = set(card.key_numbers).intersection(set(card.numbers))
+        win_count = len(wins)
+
+        for k in range(i + 1, i + win_count + 1):
+            card_counts[k] += card_counts[i]
+
+    return sum(card_counts.values())
+
+
+def total_cards(wins: list[int]) -> int:
+    # Card i adds its copies to the next wins[i] cards. Record that as +copies at i + 1 and -copies past the last
+    # card it wins, and keep a running sum: O(1) per card whatever it wins.
+    n = len(wins)
+    diff = [0] * (n + 1)
+
+    total = 0
+    running = 0
+    for i, win_count in enumerate(wins):
+        running += diff[i]
+        copies = 1 + running
+        total += copies
+
+        diff[i + 1] += copies
+        diff[min(i + win_count + 1, n)] -= copies
+
+    return total
 
-start = time.time()
 
-cards = [Card.from_str(line) for line in lines]
-card_counts = dict.fromkeys(range(len(cards)), 1)
+def run_bitset(path: str = "data/input") -> int:
+    return total_cards(win_counts(read_file(path)))
 
-for i, card in enumerate(cards):
-    wins = set(card.key_numbers).intersection(set(card.numbers))
-    win_count = len(wins)
 
-    for k in range(i + 1, i + win_count + 1):
-        card_counts[k] += card_counts[i]
+def run_numpy(path: str = "data/input") -> int:
+    return total_cards(batch_win_counts(*load_deck(read_file(path))).tolist())
 
-end = time.time()
 
-result = sum(card_counts.values())
-print(f"{result} in {end - start} seconds")
+if __name__ == "__main__":
+    print(run())
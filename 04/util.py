@@ -0,0 +1,53 @@
+import numpy as np
+
+
+def number_mask(numbers: str) -> int:
+    # Bit n is set when n is one of the numbers.
+    mask = 0
+    for number in numbers.split():
+        mask |= 1 << int(number)
+
+    return mask
+
+
+def win_counts(lines: list[str]) -> list[int]:
+    counts = []
+    for line in lines:
+        key_numbers, numbers = line.split(":")[1].split("|")
+        counts.append((number_mask(key_numbers) & number_mask(numbers)).bit_count())
+
+    return counts
+
+
+def padded_numbers(sides: list[str], pad: int) -> np.ndarray:
+    rows = [side.split() for side in sides]
+    width = max(map(len, rows), default=0)
+
+    # Puzzle inputs have the same count on every card and parse in one go, anything else is padded row by row.
+    if all(len(row) == width for row in rows):
+        return np.array(" ".join(sides).split(), dtype=np.int64).reshape(len(rows), width)
+
+    result = np.full((len(rows), width), pad, dtype=np.int64)
+    for i, row in enumerate(rows):
+        result[i, : len(row)] = list(map(int, row))
+
+    return result
+
+
+def load_deck(lines: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    # (cards, winning numbers) and (cards, numbers you have), padded with values that never match.
+    sides = [line.split(":")[1].split("|") for line in lines]
+    return padded_numbers([key for key, _ in sides], -1), padded_numbers([have for _, have in sides], -2)
+
+
+def batch_win_counts(key_numbers: np.ndarray, numbers: np.ndarray, batch_size: int = 1 << 16) -> np.ndarray:
+    counts = np.empty(len(key_numbers), dtype=np.int64)
+
+    # Compare every winning number with every number on the card, a batch of cards at a time to bound the
+    # (batch, winning, have) comparison array.
+    for i in range(0, len(key_numbers), batch_size):
+        a = key_numbers[i : i + batch_size, :, None]
+        b = numbers[i : i + batch_size, None, :]
+        counts[i : i + batch_size] = (a == b).any(axis=2).sum(axis=1)
+
+    return counts
@@ -0,0 +1,47 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+STAGES = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+MAX_VALUE = 2**32
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of seed ranges (10 per unit) and mapping lines per stage (35 per unit)."""
+    rng = random.Random(seed)
+
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(MAX_VALUE // 2)
+        seeds.extend([start, rng.randint(1, MAX_VALUE // (8 * scaled(10, scale)))])
+
+    yield "seeds: " + " ".join(map(str, seeds))
+
+    for src_id, dest_id in zip(STAGES, STAGES[1:]):
+        yield ""
+        yield f"{src_id}-to-{dest_id} map:"
+
+        # Cut [0, MAX_VALUE) into intervals, map a random subset of them onto a shuffled layout of the same
+        # intervals so neither the sources nor the destinations overlap.
+        n_mappings = scaled(35, scale)
+        cuts = sorted(rng.sample(range(1, MAX_VALUE), n_mappings))
+        lengths = [b - a for a, b in zip([0] + cuts, cuts)]
+
+        order = list(range(n_mappings))
+        rng.shuffle(order)
+        dest_starts = [0] * n_mappings
+        cursor = 0
+        for i in order:
+            dest_starts[i] = cursor
+            cursor += lengths[i]
+
+        mappings = [
+            (dest_starts[i], src_start, lengths[i])
+            for i, src_start in enumerate([0] + cuts[:-1])
+            if rng.random() < 0.9
+        ]
+        rng.shuffle(mappings)
+
+        for dest_start, src_start, length in mappings:
+            yield f"{dest_start} {src_start} {length}"
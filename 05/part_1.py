@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 import re
 from typing import Generator, Optional, TypeVar
 
+import numpy as np
+
+from util import IntervalIndex, compose_chain
+
 T = TypeVar("T")
 
 
@@ -30,11 +35,13 @@ class ConversionMap:
     dest_id: str
     mappings: list[Mapping]
 
-    def convert(self, value: int):
-        candidates = (m.convert(value) for m in self.mappings)
-        result = next((c for c in candidates if c is not None), None)
+    index: IntervalIndex = field(init=False, repr=False)
 
-        return result or value
+    def __post_init__(self):
+        self.index = IntervalIndex.from_mappings((m.src_start, m.dest_start, m.length) for m in self.mappings)
+
+    def convert(self, value: int):
+        return self.index.lookup(value)
 
 
 def chunk_by_value(xs: list[T], value: T) -> Generator[T, None, None]:
@@ -50,13 +57,7 @@ def chunk_by_value(xs: list[T], value: T) -> Generator[T, None, None]:
     yield chunk
 
 
-lines = [line.strip() for line in read_file("data/input")]
-seed_line, *lines = lines
-
-seeds = list(map(int, seed_line.removeprefix("seeds:").strip().split()))
-
-
-def load_data():
+def load_data(lines: list[str]):
     # "src -> dest" -> Mapping
     maps: dict[str, ConversionMap] = {}
 
@@ -94,8 +95,54 @@ def full_conversion(maps: dict[str, ConversionMap], seed: int) -> int:
     return value
 
 
-maps = load_data()
+def full_conversion_batch(maps: dict[str, ConversionMap], seeds: np.ndarray) -> np.ndarray:
+    key = "seed"
+    values = seeds.astype(np.int64)
+
+    while key in maps:
+        values = maps[key].index.lookup_many(values)
+        key = maps[key].dest_id
+
+    return values
+
+
+@cache
+def composed_almanac(almanac: tuple[str, ...]) -> IntervalIndex:
+    # Cached on the almanac text, so new seeds against the same almanac skip composing the stages again.
+    return compose_chain(load_data(list(almanac)))
+
+
+def run(path: str = "data/input") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
+
+    seeds = list(map(int, seed_line.removeprefix("seeds:").strip().split()))
+    maps = load_data(lines)
+
+    return min([full_conversion(maps, seed) for seed in seeds])
+
+
+def run_numpy(path: str = "data/input") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
+
+    seeds = np.array(seed_line.removeprefix("seeds:").split(), dtype=np.int64)
+    maps = load_data(lines)
+
+    return int(full_conversion_batch(maps, seeds).min())
+
+
+def run_composed(path: str = "data/input") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
+
+    seeds = map(int, seed_line.removeprefix("seeds:").strip().split())
+    index = composed_almanac(tuple(lines))
+
+    return min(index.lookup(seed) for seed in seeds)
+
 
-print(min([full_conversion(maps, seed) for seed in seeds]))
+if __name__ == "__main__":
+    print(run())
 
 # Divide and conquer: log(n), divide search space by 2 each time. n / 2 to left and right
@@ -1,8 +1,11 @@
 from dataclasses import dataclass, field
+from functools import cache, cached_property
 import re
 from typing import Optional, TypeVar
 
-from util import chunk_by_size, chunk_by_value
+import numpy as np
+
+from util import IntervalIndex, InverseIndex, RangeSet, chain, chunk_by_size, chunk_by_value, compose_chain
 
 T = TypeVar("T")
 
@@ -34,57 +37,6 @@ class Range:
 
         return Range(start=start_value, length=end_value - start_value + 1)
 
-    def difference(self, ranges: list["Range"]) -> list["Range"]:
-        if len(ranges) == 0:
-            return [self]
-
-        r0 = ranges[0]
-        if r0 == self:
-            return []
-
-        result = []
-
-        ranges.sort(key=lambda r: r.start)
-
-        if ranges[0].start > self.start:
-            result.append(Range(start=self.start, length=ranges[0].start - self.start + 1))
-
-        for i in range(len(ranges)):
-            r = ranges[i]
-            if r.start < self.end and r.end > self.end:
-                break
-
-            start = r.end
-            end = self.end if i == len(ranges) - 1 else ranges[i + 1].start
-            result.append(Range(start, end - start + 1))
-
-        return result
-
-    def difference_old(self, ranges: list["Range"]) -> list["Range"]:
-        if len(ranges) == 0:
-            return [self]
-
-        ranges.sort(key=lambda r: r.start)
-
-        result = []
-        cursor = self.start
-        for r in ranges:
-            range_length = r.start - cursor
-
-            cursor = max(cursor, r.end + 1)
-
-            if r.start <= cursor:
-                continue
-
-            result.append(Range(start=cursor, length=r.start - range_length))
-            if cursor > self.end:
-                return result
-
-        if cursor > self.start:
-            return [Range(start=cursor, length=self.end - cursor + 1)]
-
-        return result
-
 
 @dataclass
 class Mapping:
@@ -144,19 +96,24 @@ class ConversionMap:
         self.src_id = src_id
         self.dest_id = dest_id
         self.mappings = mappings
+        self.index = IntervalIndex.from_mappings((m.src.start, m.dest.start, m.src.length) for m in mappings)
 
     def map_range(self, r: Range):
-        result = []
-        intersections = []
+        return [
+            Range(start=start + offset, length=stop - start)
+            for start, stop, offset in self.index.split(r.start, r.end + 1)
+        ]
 
-        for mapping in self.mappings:
-            if intersection := mapping.intersect(r):
-                result.extend(mapping.map_range(intersection))
-                intersections.append(intersection)
+    def map_ranges(self, ranges: RangeSet) -> RangeSet:
+        return self.index.map_ranges(ranges)
 
-        result.extend(r.difference(intersections))
+    @cached_property
+    def inverse(self) -> InverseIndex:
+        return self.index.inverted()
 
-        return result
+    def unmap_ranges(self, ranges: RangeSet) -> RangeSet:
+        # Every src value that converts into ranges.
+        return self.inverse.preimage(ranges)
 
 
 def load_data(lines: list[str]):
@@ -178,31 +135,119 @@ def load_data(lines: list[str]):
     return maps
 
 
-lines = [line.strip() for line in read_file("data/input")]
-seed_line, *lines = lines
+@cache
+def composed_almanac(almanac: tuple[str, ...]) -> IntervalIndex:
+    # Cached on the almanac text, so new seeds against the same almanac skip composing the stages again.
+    return compose_chain(load_data(list(almanac)))
+
+
+def run(path: str = "data/input") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
+
+    seed_chunks = chunk_by_size(map(int, seed_line.removeprefix("seeds:").strip().split()), 2)
+    seed_ranges = [Range(start=start_value, length=length) for start_value, length in seed_chunks]
+
+    maps = load_data(lines)
+
+    key = "seed"
+    ranges = seed_ranges
+    while key in maps:
+        conversion_map = maps[key]
+        next_key = conversion_map.dest_id
+
+        new_ranges = []
+
+        for r in ranges:
+            new_ranges.extend(conversion_map.map_range(r))
+
+        ranges = new_ranges
+
+        key = next_key
+
+    ranges.sort(key=lambda r: r.start)
+    return ranges[0].start
+
+
+def min_location_forward(maps: dict[str, ConversionMap], seeds: RangeSet) -> int:
+    ranges = seeds
+    for conversion_map in chain(maps):
+        ranges = conversion_map.map_ranges(ranges)
+
+    return ranges.min()
+
+
+def min_location_backward(maps: dict[str, ConversionMap], seeds: RangeSet) -> int:
+    stages = chain(maps)
+    boundaries = stages[-1].inverse.boundaries()
+
+    # Pull ever longer prefixes of the location space, cut at the last stage's interval boundaries, back to seeds.
+    # The first prefix that reaches a seed holds the answer, and only its seeds are pushed forward again.
+    n = 1
+    while True:
+        end = boundaries[min(n, len(boundaries)) - 1]
+        candidates = RangeSet(np.array([0]), np.array([end]))
+        for conversion_map in reversed(stages):
+            candidates = conversion_map.unmap_ranges(candidates)
+
+        hits = candidates.intersect(seeds)
+        if len(hits) > 0 or n >= len(boundaries):
+            return min_location_forward(maps, hits)
+
+        n *= 2
+
+
+def min_location(maps: dict[str, ConversionMap], seeds: RangeSet, strategy: str = "auto") -> int:
+    if strategy == "auto":
+        # Going forward, every interval start inside a seed range splits it at the first stage. Going backward, each
+        # step pulls back a prefix cut at the last stage's boundaries, and there are about twice its intervals of those.
+        stages = chain(maps)
+        first, last = stages[0], stages[-1]
+        forward_cost = len(seeds) + int(seeds.contains(np.array(first.index.starts)).sum())
+        backward_cost = 2 * len(last.index.starts)
+        strategy = "backward" if backward_cost < forward_cost else "forward"
+
+    match strategy:
+        case "forward":
+            return min_location_forward(maps, seeds)
+        case "backward":
+            return min_location_backward(maps, seeds)
+        case _:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+
+def run_rangeset(path: str = "data/input", strategy: str = "auto") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
+
+    seed_chunks = chunk_by_size(map(int, seed_line.removeprefix("seeds:").strip().split()), 2)
+    seeds = RangeSet.from_intervals((start, start + length) for start, length in seed_chunks)
+
+    return min_location(load_data(lines), seeds, strategy)
 
 
-seed_chunks = chunk_by_size(map(int, seed_line.removeprefix("seeds:").strip().split()), 2)
-seed_ranges = [Range(start=start_value, length=length) for start_value, length in seed_chunks]
+def run_forward(path: str = "data/input") -> int:
+    return run_rangeset(path, "forward")
 
-maps = load_data(lines)
 
-key = "seed"
-ranges = seed_ranges
-while key in maps:
-    conversion_map = maps[key]
-    next_key = conversion_map.dest_id
+def run_backward(path: str = "data/input") -> int:
+    return run_rangeset(path, "backward")
 
-    new_ranges = []
 
-    for r in ranges:
-        new_ranges.extend(conversion_map.map_range(r))
+def run_composed(path: str = "data/input") -> int:
+    lines = [line.strip() for line in read_file(path)]
+    seed_line, *lines = lines
 
-    ranges = new_ranges
+    seed_chunks = chunk_by_size(map(int, seed_line.removeprefix("seeds:").strip().split()), 2)
+    index = composed_almanac(tuple(lines))
 
-    key = next_key
+    # The composed map only shifts within an interval, so each piece is smallest at its start.
+    return min(
+        start + offset
+        for seed_start, length in seed_chunks
+        for start, _, offset in index.split(seed_start, seed_start + length)
+    )
 
 
-ranges.sort(key=lambda r: r.start)
-# print(ranges)
-print(ranges[0].start)
+if __name__ == "__main__":
+    print(run())
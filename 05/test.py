@@ -1,28 +1,57 @@
-from dataclasses import dataclass
+import random
 
+from util import IntervalIndex, RangeSet
 
-@dataclass
-class Range:
-    start: int
-    end: int
+# Checks RangeSet and IntervalIndex.map_ranges against plain Python sets on a small universe.
+UNIVERSE = 60
+rng = random.Random(0)
 
 
-def difference(r: Range, ranges: list[Range]) -> list[Range]:
-    result = []
+def random_intervals(n: int) -> list[tuple[int, int]]:
+    # Possibly overlapping, unsorted and empty intervals.
+    intervals = []
+    for _ in range(n):
+        start = rng.randrange(UNIVERSE)
+        intervals.append((start, start + rng.randrange(12)))
 
-    ranges.sort(key=lambda r: r.start)
-    for i in range(len(ranges)):
-        if ranges[i].start < r.end and ranges[i].end > r.end:
-            break
+    return intervals
 
-        start = min(ranges[i].end, r.end)
-        end = r.end if i == len(ranges) - 1 else ranges[i + 1].start
-        result.append(Range(start, end))
 
-    return result
+def to_set(ranges: RangeSet) -> set[int]:
+    return {value for start, stop in ranges for value in range(start, stop)}
 
 
-a = Range(100, 200)
-b = [Range(90, 105), Range(150, 160), Range(170, 180), Range(190, 300)]
+def is_canonical(ranges: RangeSet) -> bool:
+    bounds = [value for interval in ranges for value in interval]
+    return all(a < b for a, b in zip(bounds, bounds[1:])) and all(start < stop for start, stop in ranges)
 
-print(difference(a, b))
+
+for _ in range(2000):
+    a_intervals, b_intervals = random_intervals(rng.randrange(6)), random_intervals(rng.randrange(6))
+    a, b = RangeSet.from_intervals(a_intervals), RangeSet.from_intervals(b_intervals)
+    a_set = {value for start, stop in a_intervals for value in range(start, stop)}
+    b_set = {value for start, stop in b_intervals for value in range(start, stop)}
+
+    offset = rng.randrange(-10, 10)
+    checks = [
+        (a, a_set),
+        (a.union(b), a_set | b_set),
+        (a.intersect(b), a_set & b_set),
+        (a.subtract(b), a_set - b_set),
+        (a.shift(offset), {value + offset for value in a_set}),
+    ]
+
+    for ranges, expected in checks:
+        assert is_canonical(ranges), list(ranges)
+        assert to_set(ranges) == expected, (a_intervals, b_intervals, list(ranges), expected)
+
+    # Mapping a set through an index is the same as mapping every value on its own.
+    cuts = sorted(rng.sample(range(UNIVERSE + 10), 6))
+    mappings = [(start, rng.randrange(UNIVERSE), stop - start) for start, stop in zip(cuts[::2], cuts[1::2])]
+    index = IntervalIndex.from_mappings(mappings)
+
+    mapped = index.map_ranges(a)
+    assert is_canonical(mapped), list(mapped)
+    assert to_set(mapped) == {index.lookup(value) for value in a_set}
+
+print("ok")
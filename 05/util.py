@@ -1,8 +1,16 @@
-from typing import Generator, TypeVar
+from bisect import bisect_right
+from dataclasses import dataclass
+import math
+from typing import Callable, Generator, Iterable, Iterator, TypeVar
+
+import numpy as np
 
 
 T = TypeVar("T")
 
+# Stands in for the open end of the last interval of an IntervalIndex where arrays need a number.
+UNBOUNDED = 2**62
+
 
 def chunk_by_size(xs: list[T], chunk_size: int) -> Generator[T, None, None]:
     chunk = []
@@ -27,3 +35,216 @@ def chunk_by_value(xs: list[T], value: T) -> Generator[T, None, None]:
                 chunk.append(x)
 
     yield chunk
+
+
+@dataclass
+class IntervalIndex:
+    """
+    A piecewise shift of [0, inf): values in [starts[i], starts[i + 1]) map to value + offsets[i]. Gaps between
+    mappings are filled with offset 0, so every non-negative value falls in exactly one interval.
+    """
+
+    starts: list[int]
+    offsets: list[int]
+
+    @staticmethod
+    def from_mappings(mappings: Iterable[tuple[int, int, int]]) -> "IntervalIndex":
+        # (src_start, dest_start, length) triples whose sources don't overlap.
+        starts, offsets = [], []
+        cursor = 0
+
+        def add(start: int, offset: int):
+            if offsets and offsets[-1] == offset:
+                return
+            starts.append(start)
+            offsets.append(offset)
+
+        for src_start, dest_start, length in sorted(mappings):
+            if length <= 0:
+                continue
+            if src_start > cursor:
+                add(cursor, 0)
+            add(src_start, dest_start - src_start)
+            cursor = src_start + length
+
+        add(cursor, 0)
+
+        return IntervalIndex(starts, offsets)
+
+    def lookup(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def lookup_many(self, values: np.ndarray) -> np.ndarray:
+        starts = np.array(self.starts, dtype=np.int64)
+        offsets = np.array(self.offsets, dtype=np.int64)
+
+        return values + offsets[np.searchsorted(starts, values, side="right") - 1]
+
+    def split(self, start: int, stop: float) -> Iterator[tuple[int, int, int]]:
+        # The pieces of [start, stop) that share an offset, as (start, stop, offset). stop may be math.inf.
+        i = bisect_right(self.starts, start) - 1
+        while start < stop:
+            piece_stop = min(stop, self.starts[i + 1]) if i + 1 < len(self.starts) else stop
+            yield start, piece_stop, self.offsets[i]
+            start = piece_stop
+            i += 1
+
+    def then(self, other: "IntervalIndex") -> "IntervalIndex":
+        # The index of other.lookup(self.lookup(value)): the image of each of our intervals is cut up by other's.
+        starts, offsets = [], []
+        for i, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            stop = self.starts[i + 1] if i + 1 < len(self.starts) else math.inf
+            for piece_start, _, piece_offset in other.split(start + offset, stop + offset):
+                if not offsets or offsets[-1] != offset + piece_offset:
+                    starts.append(piece_start - offset)
+                    offsets.append(offset + piece_offset)
+
+        return IntervalIndex(starts, offsets)
+
+    def map_ranges(self, ranges: "RangeSet") -> "RangeSet":
+        # Cut the ranges at our interval starts, shift every piece by its offset and merge what lands together.
+        cuts = np.array(self.starts, dtype=np.int64)
+        cuts = cuts[ranges.contains(cuts)]
+        bounds = np.unique(np.concatenate([ranges.starts, ranges.stops, cuts]))
+
+        starts, stops = bounds[:-1], bounds[1:]
+        inside = ranges.contains(starts)
+        starts, stops = starts[inside], stops[inside]
+        shifted = self.lookup_many(starts)
+
+        return RangeSet(shifted, shifted + (stops - starts)).coalesce()
+
+    def inverted(self) -> "InverseIndex":
+        starts = np.array(self.starts, dtype=np.int64)
+        stops = np.append(starts[1:], UNBOUNDED)
+        offsets = np.array(self.offsets, dtype=np.int64)
+
+        return InverseIndex(starts + offsets, stops + offsets, offsets)
+
+
+@dataclass
+class RangeSet:
+    """
+    A set of integers stored as sorted, disjoint, non-adjacent half-open intervals [starts[i], stops[i]).
+    Only coalesce accepts overlapping or unsorted intervals; every operation returns a coalesced set.
+    """
+
+    starts: np.ndarray
+    stops: np.ndarray
+
+    @staticmethod
+    def from_intervals(intervals: Iterable[tuple[int, int]]) -> "RangeSet":
+        pairs = np.array(list(intervals), dtype=np.int64).reshape(-1, 2)
+        return RangeSet(pairs[:, 0], pairs[:, 1]).coalesce()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts.tolist(), self.stops.tolist())
+
+    def size(self) -> int:
+        return int((self.stops - self.starts).sum())
+
+    def min(self) -> int:
+        return int(self.starts[0])
+
+    def contains(self, values: np.ndarray) -> np.ndarray:
+        if len(self) == 0:
+            return np.zeros(len(values), dtype=bool)
+
+        i = np.searchsorted(self.starts, values, side="right") - 1
+        return (i >= 0) & (values < self.stops[np.maximum(i, 0)])
+
+    def shift(self, offset: int) -> "RangeSet":
+        return RangeSet(self.starts + offset, self.stops + offset)
+
+    def coalesce(self) -> "RangeSet":
+        return self._combine(EMPTY, lambda a, b: a)
+
+    def union(self, other: "RangeSet") -> "RangeSet":
+        return self._combine(other, lambda a, b: a | b)
+
+    def intersect(self, other: "RangeSet") -> "RangeSet":
+        return self._combine(other, lambda a, b: a & b)
+
+    def subtract(self, other: "RangeSet") -> "RangeSet":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def _combine(self, other: "RangeSet", keep: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> "RangeSet":
+        # Sweep over every interval boundary of both sets, counting how many intervals of each set cover the
+        # stretch up to the next boundary. keep decides from that which stretches are in the result.
+        empty = np.zeros(0, dtype=np.int64)
+        mine = self.starts < self.stops
+        theirs = other.starts < other.stops
+        a_starts, a_stops = self.starts[mine], self.stops[mine]
+        b_starts, b_stops = other.starts[theirs], other.stops[theirs]
+
+        bounds, inverse = np.unique(np.concatenate([a_starts, a_stops, b_starts, b_stops]), return_inverse=True)
+        if len(bounds) == 0:
+            return RangeSet(empty, empty)
+
+        n_a, n_b = len(a_starts), len(b_starts)
+        delta_a = np.zeros(len(bounds), dtype=np.int64)
+        delta_b = np.zeros(len(bounds), dtype=np.int64)
+        np.add.at(delta_a, inverse[:n_a], 1)
+        np.add.at(delta_a, inverse[n_a : 2 * n_a], -1)
+        np.add.at(delta_b, inverse[2 * n_a : 2 * n_a + n_b], 1)
+        np.add.at(delta_b, inverse[2 * n_a + n_b :], -1)
+
+        kept = keep(np.cumsum(delta_a)[:-1] > 0, np.cumsum(delta_b)[:-1] > 0)
+
+        # Runs of kept stretches become one interval each.
+        edges = np.diff(np.concatenate([[False], kept, [False]]).astype(np.int8))
+        return RangeSet(bounds[:-1][edges[:-1] == 1], bounds[1:][edges[1:] == -1])
+
+
+EMPTY = RangeSet(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+
+@dataclass
+class InverseIndex:
+    """
+    The intervals of an IntervalIndex by where they land: [dest_starts[i], dest_stops[i]) is reached from the values
+    offsets[i] lower. Maps that aren't one-to-one land several intervals on the same values, so these can overlap.
+    """
+
+    dest_starts: np.ndarray
+    dest_stops: np.ndarray
+    offsets: np.ndarray
+
+    def boundaries(self) -> np.ndarray:
+        return np.unique(np.concatenate([self.dest_starts, self.dest_stops]))
+
+    def preimage(self, ranges: RangeSet) -> RangeSet:
+        # Pair every interval with the ranges it overlaps, then pull each overlap back by the interval's offset.
+        lo = np.searchsorted(ranges.stops, self.dest_starts, side="right")
+        hi = np.searchsorted(ranges.starts, self.dest_stops, side="left")
+        counts = np.maximum(hi - lo, 0)
+
+        i = np.repeat(np.arange(len(counts)), counts)
+        j = np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        starts = np.maximum(self.dest_starts[i], ranges.starts[j]) - self.offsets[i]
+        stops = np.minimum(self.dest_stops[i], ranges.stops[j]) - self.offsets[i]
+
+        return RangeSet(starts, stops).coalesce()
+
+
+def chain(maps: dict, key: str = "seed") -> list:
+    # The ConversionMaps of the src_id -> dest_id chain starting at key, in order.
+    stages = []
+    while key in maps:
+        stages.append(maps[key])
+        key = maps[key].dest_id
+
+    return stages
+
+
+def compose_chain(maps: dict, key: str = "seed") -> IntervalIndex:
+    # One index for the whole chain of ConversionMaps starting at key.
+    index = IntervalIndex([0], [0])
+    for conversion_map in chain(maps, key):
+        index = index.then(conversion_map.index)
+
+    return index
@@ -0,0 +1,18 @@
+import argparse
+import sys
+
+import numpy as np
+
+from util import load_pairs, ways_to_win_many
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Number of ways to win each race in a file of day 06 races.")
+    parser.add_argument("path", help='one "time record" pair per line')
+    args = parser.parse_args()
+
+    np.savetxt(sys.stdout, ways_to_win_many(*load_pairs(args.path)), fmt="%d")
+
+
+if __name__ == "__main__":
+    main()
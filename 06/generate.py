@@ -0,0 +1,21 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of races, 4 per unit."""
+    rng = random.Random(seed)
+
+    times = []
+    records = []
+    for _ in range(scaled(4, scale)):
+        t = rng.randint(7, 99)
+        hold = rng.randint(1, t // 2)
+        times.append(t)
+        records.append(hold * (t - hold) - rng.randint(0, hold))
+
+    width = max(len(str(x)) for x in times + records) + 2
+    yield "Time:    " + "".join(f"{x:>{width}}" for x in times)
+    yield "Distance:" + "".join(f"{x:>{width}}" for x in records)
@@ -1,5 +1,6 @@
-from math import floor, ceil, sqrt
-import numpy as np
+import math
+
+from util import ways_to_win, ways_to_win_many
 
 
 def read_file(path: str) -> list[str]:
@@ -7,17 +8,20 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-lines = read_file("data/input")
-race_times, record_distances = [map(int, x.split(":")[1].strip().split()) for x in lines]
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    race_times, record_distances = [map(int, x.split(":")[1].strip().split()) for x in lines]
+
+    result = [ways_to_win(race_time, record) for race_time, record in zip(race_times, record_distances)]
+    return math.prod(result)
 
 
-def f(t: int, r: int) -> (int, int):
-    p = sqrt(t**2 - 4 * r)
-    lower_bound = floor((1 / 2) * (t - p))
-    upper_bound = ceil((1 / 2) * (p + t))
+def run_numpy(path: str = "data/input") -> int:
+    lines = read_file(path)
+    race_times, record_distances = [x.split(":")[1].split() for x in lines]
 
-    return upper_bound - lower_bound - 1
+    return math.prod(ways_to_win_many(race_times, record_distances).tolist())
 
 
-result = [f(race_time, record_distance) for race_time, record_distance in zip(race_times, record_distances)]
-print(np.prod(result))
+if __name__ == "__main__":
+    print(run())
@@ -1,5 +1,6 @@
 import re
-from math import floor, ceil, sqrt
+
+from util import ways_to_win
 
 
 def read_file(path: str) -> list[str]:
@@ -7,18 +8,13 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-lines = read_file("data/input")
-data = [x.split(":")[1].strip() for x in lines]
-race_time, record_distance = [int(re.sub(r"\s+", "", x)) for x in data]
-
-
-def f(t: int, r: int) -> (int, int):
-    p = sqrt(t**2 - 4 * r)
-    lower_bound = floor((1 / 2) * (t - p))
-    upper_bound = ceil((1 / 2) * (p + t))
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    data = [x.split(":")[1].strip() for x in lines]
+    race_time, record_distance = [int(re.sub(r"\s+", "", x)) for x in data]
 
-    return upper_bound - lower_bound - 1
+    return ways_to_win(race_time, record_distance)
 
 
-result = f(race_time, record_distance)
-print(result)
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+
+
+def ways_to_win(time: int, record: int) -> int:
+    # Holding the button for h ms travels h * (time - h) mm. The h beating the record lie strictly between the roots
+    # of h^2 - time * h + record, symmetric around time / 2, so counting them only needs the lowest one.
+    discriminant = time * time - 4 * record
+    if discriminant <= 0:
+        return 0
+
+    # isqrt rounds down, which puts lo on the lowest winning h or one below it.
+    lo = max(0, (time - math.isqrt(discriminant)) // 2)
+    if lo * (time - lo) <= record:
+        lo += 1
+
+    return time - 2 * lo + 1
+
+
+def ways_to_win_many(times: np.ndarray, records: np.ndarray) -> np.ndarray:
+    # The same as ways_to_win over int64 arrays, which holds while times stay below 2^31 and records below 2^61.
+    times = np.asarray(times, dtype=np.int64)
+    records = np.asarray(records, dtype=np.int64)
+    if len(times) > 0 and (times.max() >= 2**31 or records.max() >= 2**61):
+        raise ValueError("times must be below 2^31 and records below 2^61, use ways_to_win for larger races")
+
+    discriminant = times * times - 4 * records
+    positive = discriminant > 0
+
+    # The float square root is off by at most one, fix it up to the exact integer square root.
+    root = np.sqrt(np.where(positive, discriminant, 0).astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+
+    lo = np.maximum(0, (times - root) // 2)
+    lo += lo * (times - lo) <= records
+
+    return np.where(positive, times - 2 * lo + 1, 0)
+
+
+def load_pairs(path: str) -> tuple[np.ndarray, np.ndarray]:
+    # One "time record" pair per line.
+    with open(path, "r") as f:
+        pairs = np.array(f.read().split(), dtype=np.int64).reshape(-1, 2)
+
+    return pairs[:, 0], pairs[:, 1]
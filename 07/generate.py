@@ -0,0 +1,25 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+CARDS = "AKQJT98765432"
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of hands, 1000 per unit, up to half of all possible hands."""
+    rng = random.Random(seed)
+
+    # Hands are unique, like in the puzzle input. There are 13^5 of them, so cap the count well below that.
+    seen: set[str] = set()
+    n_hands = min(scaled(1000, scale), 13**5 // 2)
+
+    while len(seen) < n_hands:
+        # Draw from a few ranks so pairs, full houses and so on are as common as in the puzzle input.
+        ranks = rng.sample(CARDS, rng.randint(1, 5))
+        cards = "".join(rng.choice(ranks) for _ in range(5))
+        if cards in seen:
+            continue
+
+        seen.add(cards)
+        yield f"{cards} {rng.randint(1, 1000)}"
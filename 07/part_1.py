@@ -3,6 +3,10 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from collections import Counter
 
+import numpy as np
+
+from util import card_digits, hand_codes, hand_type_table, pack_hand, pack_hands, ranked_winnings, total_winnings
+
 CARD_VALUES = {
     "A": 13,
     "K": 12,
@@ -77,12 +81,34 @@ def compare_hands(a: Hand, b: Hand) -> int:
     return CARD_VALUES[a.cards[i]] - CARD_VALUES[b.cards[i]]
 
 
-lines = read_file("data/input")
-data = [x.split() for x in lines]
-hands = [Hand(cards, int(bid)) for cards, bid in data]
-hands = sorted(hands, key=cmp_to_key(compare_hands))
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    data = [x.split() for x in lines]
+    hands = [Hand(cards, int(bid)) for cards, bid in data]
+    hands = sorted(hands, key=cmp_to_key(compare_hands))
+
+    winnings = [(i + 1) * hand.bid for i, hand in enumerate(hands)]
+    return sum(winnings)
+
+
+def run_packed(path: str = "data/input") -> int:
+    lines = read_file(path)
+    data = [x.split() for x in lines]
+    keys = [pack_hand(get_hand_type(cards), (CARD_VALUES[c] for c in cards)) for cards, _ in data]
+
+    return total_winnings(keys, [int(bid) for _, bid in data])
+
+
+def run_table(path: str = "data/input") -> int:
+    lines = read_file(path)
+    data = [x.split() for x in lines]
+    hands = [cards for cards, _ in data]
+
+    hand_types = hand_type_table(jokers=False)[hand_codes(hands)]
+    keys = pack_hands(hand_types, card_digits(hands, CARD_VALUES))
+
+    return ranked_winnings(keys, np.array([int(bid) for _, bid in data], dtype=np.int64))
 
 
-winnings = [(i + 1) * hand.bid for i, hand in enumerate(hands)]
-print(winnings)
-print(sum(winnings))
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,113 @@
+import os
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Hands are coded in base 13 over CARDS, first card in the highest digit. The order only has to be fixed, the card
+# values used for ranking live in each part.
+CARDS = "23456789TJQKA"
+CARD_CODES = {card: i for i, card in enumerate(CARDS)}
+N_HANDS = len(CARDS) ** 5
+
+CACHE_DIR = Path(__file__).parent / "data"
+
+
+def pack_hand(hand_type: int, values: Iterable[int]) -> int:
+    # The hand type above five 4-bit card values, so comparing keys compares the type first and then card by card.
+    key = hand_type
+    for value in values:
+        key = key << 4 | value
+
+    return key
+
+
+def total_winnings(keys: list[int], bids: list[int]) -> int:
+    # Pack each bid below its hand key so ranking the hands is one sort of plain ints.
+    shift = max(bids, default=0).bit_length()
+    mask = (1 << shift) - 1
+    ranked = sorted(key << shift | bid for key, bid in zip(keys, bids))
+
+    return sum(rank * (packed & mask) for rank, packed in enumerate(ranked, 1))
+
+
+def card_digits(hands: list[str], values: dict[str, int]) -> np.ndarray:
+    # (hands, 5) array of values[card], read straight from the bytes of all hands at once.
+    lookup = np.zeros(256, dtype=np.int64)
+    for card, value in values.items():
+        lookup[ord(card)] = value
+
+    return lookup[np.frombuffer("".join(hands).encode(), dtype=np.uint8)].reshape(len(hands), 5)
+
+
+def hand_codes(hands: list[str]) -> np.ndarray:
+    return card_digits(hands, CARD_CODES) @ (len(CARDS) ** np.arange(4, -1, -1))
+
+
+def build_hand_types(jokers: bool) -> np.ndarray:
+    digits = (np.arange(N_HANDS)[:, None] // len(CARDS) ** np.arange(5)) % len(CARDS)
+    counts = (digits[:, :, None] == np.arange(len(CARDS))).sum(axis=1)
+
+    joker_count = 0
+    if jokers:
+        joker_count = counts[:, CARD_CODES["J"]].copy()
+        counts[:, CARD_CODES["J"]] = 0
+
+    counts.sort(axis=1)
+    first, second = counts[:, -1] + joker_count, counts[:, -2]
+
+    # Same values as HandType in the parts.
+    return np.select(
+        [first == 5, first == 4, (first == 3) & (second == 2), first == 3, (first == 2) & (second == 2), first == 2],
+        [7, 6, 5, 4, 3, 2],
+        1,
+    ).astype(np.uint8)
+
+
+def load_hand_types(path: Path) -> Optional[np.ndarray]:
+    # A saved table, None if it is missing, unreadable or not a table of every hand.
+    try:
+        table = np.load(path)
+    except (OSError, ValueError, EOFError):
+        return None
+
+    if table.shape != (N_HANDS,) or table.dtype != np.uint8:
+        return None
+
+    return table
+
+
+@cache
+def hand_type_table(jokers: bool = False) -> np.ndarray:
+    # Every possible hand's type, indexed by hand code. Built on first use and kept in data/ for later runs.
+    path = CACHE_DIR / f"hand_types{'_jokers' if jokers else ''}.npy"
+    if (table := load_hand_types(path)) is not None:
+        return table
+
+    table = build_hand_types(jokers)
+
+    # Written next to the final file and moved into place, so no run ever loads a partly written table.
+    CACHE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".npy", delete=False) as f:
+        np.save(f, table)
+    os.replace(f.name, path)
+
+    return table
+
+
+def pack_hands(hand_types: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # pack_hand over arrays.
+    keys = hand_types.astype(np.int64)
+    for i in range(values.shape[1]):
+        keys = keys << 4 | values[:, i]
+
+    return keys
+
+
+def ranked_winnings(keys: np.ndarray, bids: np.ndarray) -> int:
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[np.argsort(keys, kind="stable")] = np.arange(1, len(keys) + 1)
+
+    return int((ranks * bids).sum())
@@ -0,0 +1,49 @@
+import random
+from itertools import product
+from typing import Iterator
+
+from aoc.gen import scaled
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PRIMES = [43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113]
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """
+    scale: length of the instructions (281 per unit) and of the ghost loops (a prime around 70 per unit).
+
+    Node names are three letters, so the network itself stops growing at about 16k nodes.
+
+    Every ghost ??A walks a loop of two nodes per column: both exits of a column lead into the next column and the
+    last column leads into ??Z, whose exits are the same as those of ??A. Whatever the instructions, a ghost is back
+    on ??Z every len(loop) steps. AAA is the first ghost and ends on ZZZ.
+    """
+    rng = random.Random(seed)
+
+    n_ghosts = 6
+    middle_names = ["".join(p) for p in product(LETTERS, LETTERS, LETTERS[1:-1])]
+    rng.shuffle(middle_names)
+    primes = rng.sample(PRIMES, n_ghosts)
+    multiplier = min(scaled(1, scale), len(middle_names) // (2 * sum(primes)))
+
+    start_names = ["AAA"] + rng.sample([a + b + "A" for a, b in product(LETTERS, LETTERS) if a + b != "AA"], 5)
+    end_names = ["ZZZ"] + rng.sample([a + b + "Z" for a, b in product(LETTERS, LETTERS) if a + b != "ZZ"], 5)
+
+    nodes: list[tuple[str, str, str]] = []
+    for start, end, prime in zip(start_names, end_names, primes):
+        columns = [(middle_names.pop(), middle_names.pop()) for _ in range(prime * multiplier - 1)]
+
+        first = columns[0]
+        nodes.append((start, *first))
+        nodes.append((end, *first))
+        for (a, b), (next_a, next_b) in zip(columns, columns[1:]):
+            nodes.append((a, next_a, next_b))
+            nodes.append((b, next_b, next_a))
+        nodes.extend([(name, end, end) for name in columns[-1]])
+
+    rng.shuffle(nodes)
+
+    yield "".join(rng.choice("LR") for _ in range(scaled(281, scale)))
+    yield ""
+    for node, l, r in nodes:
+        yield f"{node} = ({l}, {r})"
@@ -1,20 +1,26 @@
 import re
 from typing import Generator
 
+import numpy as np
+
+from util import build_run_tables, compile_network, first_arrival
+
 
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
         return [line.strip() for line in f.readlines()]
 
 
-node_lines = read_file("data/input")
-directions, _, *node_lines = node_lines
+def load_data(lines: list[str]) -> tuple[str, dict[str, tuple[str, str]]]:
+    directions, _, *node_lines = lines
 
-node_map: dict[str, tuple[str, str]] = {}
-for line in node_lines:
-    node, l, r = re.match(r"([A-Z]{3}) = \(([A-Z]{3}), ([A-Z]{3})\)", line).groups()
+    node_map: dict[str, tuple[str, str]] = {}
+    for line in node_lines:
+        node, l, r = re.match(r"([A-Z]{3}) = \(([A-Z]{3}), ([A-Z]{3})\)", line).groups()
 
-    node_map[node] = (l, r)
+        node_map[node] = (l, r)
+
+    return directions, node_map
 
 
 def repeat(xs: list[str]) -> Generator[str, None, None]:
@@ -23,13 +29,26 @@ def repeat(xs: list[str]) -> Generator[str, None, None]:
             yield x
 
 
-direction_generator = repeat(directions)
+def run(path: str = "data/input") -> int:
+    directions, node_map = load_data(read_file(path))
+    direction_generator = repeat(directions)
+
+    steps = 0
+    node = "AAA"
+    while node != "ZZZ":
+        steps += 1
+        l, r = node_map[node]
+        node = l if next(direction_generator) == "L" else r
+
+    return steps
+
+
+def run_compiled(path: str = "data/input") -> int:
+    network = compile_network(*load_data(read_file(path)))
+    targets = np.array([name == "ZZZ" for name in network.names])
+
+    return first_arrival(network, build_run_tables(network, targets), network.ids["AAA"])
 
-steps = 0
-node = "AAA"
-while node != "ZZZ":
-    steps += 1
-    l, r = node_map[node]
-    node = l if next(direction_generator) == "L" else r
 
-print(steps)
+if __name__ == "__main__":
+    print(run())
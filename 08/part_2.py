@@ -1,22 +1,36 @@
 import re
-from typing import Generator
+from typing import Generator, Optional
 from math import gcd
 from functools import reduce
 
+import numpy as np
+
+from util import (
+    advance,
+    analyse_ghosts,
+    build_run_tables,
+    compile_network,
+    first_arrival,
+    first_common_hit,
+    next_arrival,
+)
+
 
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
         return [line.strip() for line in f.readlines()]
 
 
-node_lines = read_file("data/input")
-directions, _, *node_lines = node_lines
+def load_data(lines: list[str]) -> tuple[str, dict[str, tuple[str, str]]]:
+    directions, _, *node_lines = lines
 
-node_map: dict[str, tuple[str, str]] = {}
-for line in node_lines:
-    node, l, r = re.match(r"([[A-Z\d]{3}) = \(([A-Z\d]{3}), ([A-Z\d]{3})\)", line).groups()
+    node_map: dict[str, tuple[str, str]] = {}
+    for line in node_lines:
+        node, l, r = re.match(r"([[A-Z\d]{3}) = \(([A-Z\d]{3}), ([A-Z\d]{3})\)", line).groups()
 
-    node_map[node] = (l, r)
+        node_map[node] = (l, r)
+
+    return directions, node_map
 
 
 def repeat(xs: list[str]) -> Generator[str, None, None]:
@@ -25,34 +39,63 @@ def repeat(xs: list[str]) -> Generator[str, None, None]:
             yield x
 
 
-step = 1
-direction_generator = repeat(directions)
-nodes = [x for x in node_map.keys() if x.endswith("A")]
+def lcd(xs: list[int]) -> int:
+    return reduce(lambda a, b: a * b // gcd(a, b), xs)
+
 
+def run(path: str = "data/input") -> int:
+    directions, node_map = load_data(read_file(path))
 
-factors = []
-z_hits: dict[str, int] = {}
-while len(nodes) > 0:
-    direction = next(direction_generator)
-    dir_index = 0 if direction == "L" else 1
+    step = 1
+    direction_generator = repeat(directions)
+    nodes = [x for x in node_map.keys() if x.endswith("A")]
 
-    # Reversed to be able to delete nodes while iterating
-    for i in reversed(range(len(nodes))):
-        node = nodes[i]
-        next_node = node_map[node][dir_index]
-        nodes[i] = next_node
+    factors = []
+    z_hits: dict[str, int] = {}
+    while len(nodes) > 0:
+        direction = next(direction_generator)
+        dir_index = 0 if direction == "L" else 1
 
-        if next_node.endswith("Z"):
-            if next_node in z_hits:
-                factors.append(step - z_hits[next_node])
-                del nodes[i]
-            else:
-                z_hits[next_node] = step
-    step += 1
+        # Reversed to be able to delete nodes while iterating
+        for i in reversed(range(len(nodes))):
+            node = nodes[i]
+            next_node = node_map[node][dir_index]
+            nodes[i] = next_node
 
+            if next_node.endswith("Z"):
+                if next_node in z_hits:
+                    factors.append(step - z_hits[next_node])
+                    del nodes[i]
+                else:
+                    z_hits[next_node] = step
+        step += 1
 
-def lcd(xs: list[int]) -> int:
-    return reduce(lambda a, b: a * b // gcd(a, b), xs)
+    return lcd(factors)
+
+
+def run_compiled(path: str = "data/input") -> int:
+    network = compile_network(*load_data(read_file(path)))
+    tables = build_run_tables(network, np.array([name.endswith("Z") for name in network.names]))
+
+    # Same assumption as run: every ghost comes back to Z at a fixed period, taken as the gap between its first two
+    # hits.
+    factors = []
+    for name in network.names:
+        if name.endswith("A"):
+            first = first_arrival(network, tables, network.ids[name])
+            node = advance(network, tables, network.ids[name], first)
+            factors.append(next_arrival(network, tables, node, first % len(network.directions)))
+
+    return lcd(factors)
+
+
+def run_cycles(path: str = "data/input", workers: Optional[int] = None) -> int:
+    network = compile_network(*load_data(read_file(path)))
+    tables = build_run_tables(network, np.array([name.endswith("Z") for name in network.names]))
+
+    starts = [i for i, name in enumerate(network.names) if name.endswith("A")]
+    return first_common_hit(analyse_ghosts(network, tables, starts, workers))
 
 
-print(lcd(factors))
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,44 @@
+import random
+
+import numpy as np
+
+from part_1 import load_data, read_file
+from util import advance, build_run_tables, compile_network, walk
+
+# Checks advance against stepping, directly for small step counts and through the run map's cycle for huge ones.
+network = compile_network(*load_data(read_file("data/input")))
+tables = build_run_tables(network, np.zeros(len(network.names), dtype=bool))
+n_directions = len(network.directions)
+rng = random.Random(0)
+
+
+def walk_far(node: int, steps: int) -> int:
+    # Whole runs on the run map until it repeats, skip the remaining cycles, then step what is left.
+    runs, rest = divmod(steps, n_directions)
+    seen: dict[int, int] = {}
+    i = 0
+    while i < runs:
+        if node in seen:
+            cycle = i - seen[node]
+            i += (runs - i) // cycle * cycle
+            seen = {}
+            if i == runs:
+                break
+
+        seen[node] = i
+        node = int(tables.jumps[0][node])
+        i += 1
+
+    return walk(network, node, 0, rest)
+
+
+for _ in range(100):
+    node = rng.randrange(len(network.names))
+    steps = rng.randrange(20 * n_directions)
+    assert advance(network, tables, node, steps) == walk(network, node, 0, steps)
+
+for steps in [10**6, 10**9, 10**9 + 7, 3 * 10**9 + rng.randrange(n_directions), 10**18]:
+    node = network.ids["AAA"]
+    assert advance(network, tables, node, steps) == walk_far(node, steps), steps
+
+print("ok")
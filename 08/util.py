@@ -0,0 +1,252 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from math import gcd
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class Network:
+    names: list[str]
+    ids: dict[str, int]
+    left: np.ndarray
+    right: np.ndarray
+
+    # 0 for L, 1 for R
+    directions: list[int]
+
+    def step(self, nodes, direction: int):
+        return (self.left, self.right)[direction][nodes]
+
+
+def compile_network(directions: str, node_map: dict[str, tuple[str, str]]) -> Network:
+    names = list(node_map)
+    ids = {name: i for i, name in enumerate(names)}
+    left = np.array([ids[l] for l, _ in node_map.values()], dtype=np.int64)
+    right = np.array([ids[r] for _, r in node_map.values()], dtype=np.int64)
+
+    return Network(names, ids, left, right, [0 if d == "L" else 1 for d in directions])
+
+
+@dataclass
+class RunTables:
+    """
+    What one run through the whole instruction string does, from every node at once.
+
+    jumps[k][v] is the node reached after 2^k runs from v, and hits[k][v] whether any target is passed on the way.
+    first_hit[v] is the number of steps into a run from v at which a target is first reached, -1 if none is.
+    """
+
+    targets: np.ndarray
+    jumps: list[np.ndarray]
+    hits: list[np.ndarray]
+    first_hit: np.ndarray
+
+    def extend(self, levels: int):
+        # Lift further until there are at least levels jump tables.
+        while len(self.jumps) < levels:
+            self.jumps.append(self.jumps[-1][self.jumps[-1]])
+            self.hits.append(self.hits[-1] | self.hits[-1][self.jumps[-2]])
+
+
+def build_run_tables(network: Network, targets: np.ndarray) -> RunTables:
+    position = np.arange(len(network.names))
+    first_hit = np.full(len(network.names), -1)
+
+    for i, direction in enumerate(network.directions, 1):
+        position = network.step(position, direction)
+        first_hit[(first_hit < 0) & targets[position]] = i
+
+    tables = RunTables(targets, [position], [first_hit >= 0], first_hit)
+
+    # After as many runs as there are nodes, a walk that never passed a target never will. advance lifts further
+    # when it is asked for more runs than that.
+    tables.extend(len(network.names).bit_length() + 1)
+
+    return tables
+
+
+def walk(network: Network, node: int, phase: int, steps: int) -> int:
+    # Step by step, starting phase steps into the instructions.
+    for i in range(phase, phase + steps):
+        node = network.step(node, network.directions[i % len(network.directions)])
+
+    return int(node)
+
+
+def advance(network: Network, tables: RunTables, node: int, steps: int) -> int:
+    # Node reached after any number of steps from the start of the instructions, in O(log steps) jumps.
+    runs, rest = divmod(steps, len(network.directions))
+    tables.extend(runs.bit_length())
+    for k in range(runs.bit_length()):
+        if runs >> k & 1:
+            node = tables.jumps[k][node]
+
+    return walk(network, int(node), 0, rest)
+
+
+def first_arrival(network: Network, tables: RunTables, node: int) -> Optional[int]:
+    # Steps from the start of the instructions until node first reaches a target, None if it never does.
+    if tables.first_hit[node] >= 0:
+        return int(tables.first_hit[node])
+
+    # Take the largest number of whole runs that pass no target, the run after it is the one that does.
+    runs = 0
+    for k in reversed(range(len(tables.jumps))):
+        if not tables.hits[k][node]:
+            node = tables.jumps[k][node]
+            runs += 1 << k
+
+    if tables.first_hit[node] < 0:
+        return None
+
+    return runs * len(network.directions) + int(tables.first_hit[node])
+
+
+def next_arrival(network: Network, tables: RunTables, node: int, phase: int) -> Optional[int]:
+    # Like first_arrival, but starting phase steps into the instructions: finish that run by hand first.
+    steps = 0
+    for direction in network.directions[phase:] if phase else []:
+        node = network.step(node, direction)
+        steps += 1
+        if tables.targets[node]:
+            return steps
+
+    rest = first_arrival(network, tables, int(node))
+    return None if rest is None else steps + rest
+
+
+@dataclass
+class GhostCycle:
+    """
+    Where a walk from the start of the instructions reaches a target. From step tail on, it repeats every length
+    steps. tail_hits are the steps before tail that reach a target, cycle_hits those in [tail, tail + length).
+    """
+
+    tail: int
+    length: int
+    tail_hits: list[int]
+    cycle_hits: list[int]
+
+    def hits(self, step: int) -> bool:
+        if step < self.tail:
+            return step in self.tail_hits
+
+        return self.tail + (step - self.tail) % self.length in self.cycle_hits
+
+
+def analyse_ghost(network: Network, tables: RunTables, start: int) -> GhostCycle:
+    # A walk is back where it was once it starts a run on a node it started a run on before, so the cycle is found
+    # on the run map alone. At most one run start per node.
+    run_starts: dict[int, int] = {}
+    node = start
+    while node not in run_starts:
+        run_starts[node] = len(run_starts)
+        node = int(tables.jumps[0][node])
+
+    n_runs = len(run_starts)
+    tail = run_starts[node] * len(network.directions)
+
+    # Then walk all the runs side by side to find every step that reaches a target.
+    hits = []
+    position = np.array(list(run_starts))
+    for i, direction in enumerate(network.directions, 1):
+        position = network.step(position, direction)
+        hits.extend((np.nonzero(tables.targets[position])[0] * len(network.directions) + i).tolist())
+
+    hits.sort()
+    length = n_runs * len(network.directions) - tail
+    # The last run ends where the cycle starts, so its final step counts as the cycle's first.
+    offsets = sorted({(h - tail) % length for h in hits if h >= tail})
+
+    # The hits often repeat more often than the walk does (a loop of 7 nodes walked with 3 instructions repeats
+    # every 21 steps but may hit every 7). Keeping only the shortest period keeps the CRT choices down.
+    period = shortest_period(length, offsets)
+
+    return GhostCycle(
+        tail=tail,
+        length=period,
+        tail_hits=[h for h in hits if h < tail],
+        cycle_hits=[tail + o for o in offsets if o < period],
+    )
+
+
+def shortest_period(length: int, offsets: list[int]) -> int:
+    # The smallest divisor p of length for which offsets (in [0, length)) are the same pattern every p steps.
+    offset_set = set(offsets)
+    divisors = [d for d in range(1, int(length**0.5) + 1) if length % d == 0]
+    for p in sorted(set(divisors + [length // d for d in divisors])):
+        if len(offsets) % (length // p) == 0 and all((o + p) % length in offset_set for o in offsets):
+            return p
+
+    return length
+
+
+# Below about this many node steps in total (ghosts x nodes x instructions), analysing the ghosts takes less time
+# than starting a process pool.
+POOL_MIN_STEPS = 10**8
+
+# What analyse_ghost reads, set once in each pool worker by _init_ghost_worker.
+_worker_network: Optional[Network] = None
+_worker_tables: Optional[RunTables] = None
+
+
+def _init_ghost_worker(left: np.ndarray, right: np.ndarray, directions: list[int], run_map: np.ndarray, targets):
+    # analyse_ghost steps through the network and reads one level of the run tables, so that is all that is sent.
+    global _worker_network, _worker_tables
+    _worker_network = Network([], {}, left, right, directions)
+    _worker_tables = RunTables(targets, [run_map], [], np.empty(0, dtype=np.int64))
+
+
+def _analyse_ghost_in_worker(start: int) -> GhostCycle:
+    return analyse_ghost(_worker_network, _worker_tables, start)
+
+
+def analyse_ghosts(
+    network: Network, tables: RunTables, starts: list[int], workers: Optional[int] = None
+) -> list[GhostCycle]:
+    steps = len(starts) * len(network.names) * len(network.directions)
+    if len(starts) <= 1 or workers == 1 or (workers is None and steps < POOL_MIN_STEPS):
+        return [analyse_ghost(network, tables, start) for start in starts]
+
+    arrays = (network.left, network.right, network.directions, tables.jumps[0], tables.targets)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_ghost_worker, initargs=arrays) as executor:
+        return list(executor.map(_analyse_ghost_in_worker, starts))
+
+
+def crt(a1: int, m1: int, a2: int, m2: int) -> Optional[tuple[int, int]]:
+    # x = a1 (mod m1) and x = a2 (mod m2) as x = a (mod lcm(m1, m2)), None when there is no such x. The moduli
+    # don't have to be coprime.
+    g = gcd(m1, m2)
+    if (a2 - a1) % g:
+        return None
+
+    modulus = m1 // g * m2
+    k = (a2 - a1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    return (a1 + k * m1) % modulus, modulus
+
+
+def first_common_hit(cycles: list[GhostCycle]) -> Optional[int]:
+    # Before the longest tail, any common step is one of that ghost's tail hits.
+    longest = max(cycles, key=lambda c: c.tail)
+    for step in longest.tail_hits:
+        if all(c.hits(step) for c in cycles):
+            return step
+
+    # From there on every ghost is in its cycle, so a common step solves one congruence per ghost, with a choice
+    # of residue for every ghost that hits more than once per cycle.
+    residues = {0}
+    modulus = 1
+    for c in cycles:
+        solutions = [crt(r, modulus, h, c.length) for r in residues for h in c.cycle_hits]
+        solutions = [s for s in solutions if s is not None]
+        if not solutions:
+            return None
+
+        modulus = solutions[0][1]
+        residues = {r for r, _ in solutions}
+
+    # The smallest step at or after the tail for each residue.
+    start = max(longest.tail, 1)
+    return min(start + (r - start) % modulus for r in residues)
@@ -0,0 +1,24 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of histories, 200 per unit."""
+    rng = random.Random(seed)
+
+    for _ in range(scaled(200, scale)):
+        # Pick the first value of every difference row, then sum back up. A history of degree d reaches all
+        # zeros after d + 1 rows, well before it runs out of its 21 values.
+        degree = rng.randint(1, 12)
+        row = [rng.randint(-10, 10)] * 21
+        for _ in range(degree):
+            value = rng.randint(-20, 20)
+            xs = [value]
+            for diff in row[:-1]:
+                value += diff
+                xs.append(value)
+            row = xs
+
+        yield " ".join(map(str, row))
@@ -1,4 +1,7 @@
 from functools import reduce
+from typing import Optional
+
+from util import extrapolate_all, stream_totals
 
 
 def read_file(path: str) -> list[str]:
@@ -6,10 +9,6 @@ def read_file(path: str) -> list[str]:
         return [x.strip() for x in f.readlines()]
 
 
-lines = read_file("data/input")
-histories = [list(map(int, x.split())) for x in lines]
-
-
 def find_next(history: list[int]):
     xs = []
 
@@ -21,5 +20,23 @@ def find_next(history: list[int]):
     return reduce(lambda x, y: y - x, reversed(xs), 0)
 
 
-result = sum([find_next(x) for x in histories])
-print(result)
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    histories = [list(map(int, x.split())) for x in lines]
+
+    return sum([find_next(x) for x in histories])
+
+
+def run_closed_form(path: str = "data/input") -> int:
+    lines = read_file(path)
+    histories = [list(map(int, x.split())) for x in lines]
+
+    return extrapolate_all(histories)[1]
+
+
+def run_streaming(path: str = "data/input", workers: Optional[int] = None) -> int:
+    return stream_totals(path, workers=workers)[1]
+
+
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,95 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import cache
+from math import comb
+import os
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+BATCH_SIZE = 4096
+
+
+@cache
+def extrapolation_weights(length: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    # Taking differences until the row is empty treats a history as a polynomial of degree length - 1, so the
+    # next value is sum(w[i] * x[i]) with w[i] = (-1)^(length - 1 - i) * C(length, i), and the previous one the same
+    # with (-1)^i * C(length, i + 1). Rows of zeros on the way add nothing, so this matches find_next exactly.
+    next_weights = tuple((-1) ** (length - 1 - i) * comb(length, i) for i in range(length))
+    previous_weights = tuple((-1) ** i * comb(length, i + 1) for i in range(length))
+
+    return next_weights, previous_weights
+
+
+def extrapolate_batch(histories: list[list[int]]) -> tuple[int, int]:
+    # Totals of the next and of the previous values of histories that all have the same length.
+    length = len(histories[0])
+    next_weights, previous_weights = extrapolation_weights(length)
+
+    # Every weight is at most 2^length in size, so this bounds every product and the totals.
+    largest = max(abs(x) for history in histories for x in history)
+    if largest * 2**length * len(histories) < 2**63:
+        weights = np.array([next_weights, previous_weights], dtype=np.int64).T
+        totals = (np.array(histories, dtype=np.int64) @ weights).sum(axis=0)
+        return int(totals[0]), int(totals[1])
+
+    next_total = sum(w * x for history in histories for w, x in zip(next_weights, history))
+    previous_total = sum(w * x for history in histories for w, x in zip(previous_weights, history))
+    return next_total, previous_total
+
+
+def extrapolate_all(histories: list[list[int]]) -> tuple[int, int]:
+    by_length: dict[int, list[list[int]]] = {}
+    for history in histories:
+        if history:
+            by_length.setdefault(len(history), []).append(history)
+
+    totals = [extrapolate_batch(batch) for batch in by_length.values()]
+    return sum(t[0] for t in totals), sum(t[1] for t in totals)
+
+
+def read_batches(lines: Iterable[str], batch_size: int = BATCH_SIZE) -> Iterator[list[list[int]]]:
+    # Histories grouped by length, a batch as soon as one length has batch_size of them and the rest at the end.
+    pending: dict[int, list[list[int]]] = {}
+    for line in lines:
+        if not (history := list(map(int, line.split()))):
+            continue
+
+        batch = pending.setdefault(len(history), [])
+        batch.append(history)
+        if len(batch) == batch_size:
+            yield pending.pop(len(history))
+
+    yield from pending.values()
+
+
+def extrapolate_stream(lines: Iterable[str], batch_size: int, workers: Optional[int]) -> Iterator[tuple[int, int]]:
+    # Totals per batch as they come back. At most two batches per worker are in flight.
+    if workers == 1:
+        yield from map(extrapolate_batch, read_batches(lines, batch_size))
+        return
+
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: set[Future] = set()
+        for batch in read_batches(lines, batch_size):
+            pending.add(executor.submit(extrapolate_batch, batch))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+        yield from (future.result() for future in pending)
+
+
+def stream_totals(path: str, batch_size: int = BATCH_SIZE, workers: Optional[int] = None) -> tuple[int, int]:
+    """
+    extrapolate_all over a report read line by line, with the batches extrapolated in a process pool.
+
+    Memory stays at a few batches per history length however long the report is.
+    """
+    next_total, previous_total = 0, 0
+    with open(path, "r") as f:
+        for next_value, previous_value in extrapolate_stream(f, batch_size, workers):
+            next_total += next_value
+            previous_total += previous_value
+
+    return next_total, previous_total
@@ -0,0 +1,50 @@
+import random
+from typing import Iterator
+
+from aoc.gen import random_loop, scaled_side
+
+JUNK = "|-LJ7F......"
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+DIRS = {(0, -1): "N", (1, 0): "E", (0, 1): "S", (-1, 0): "W"}
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of tiles, a 140 x 140 map per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(140, scale) // 2 * 2
+
+    grid = [[rng.choice(JUNK) for _ in range(side)] for _ in range(side)]
+
+    # Walk a random loop at half resolution, so the loop leaves a tile between its parallel runs. The tiles on the
+    # inside are then enclosed. Leave a margin of junk around it, the expanded map of part 2 has no room for a loop
+    # on its border.
+    coarse = random_loop(rng, side // 4 - 1, side // 4 - 1, fill=0.6)
+    loop = []
+    for (x0, y0), (x1, y1) in zip(coarse, coarse[1:] + coarse[:1]):
+        loop.append((2 * x0 + 1, 2 * y0 + 1))
+        loop.append((x0 + x1 + 1, y0 + y1 + 1))
+
+    for i, (x, y) in enumerate(loop):
+        px, py = loop[i - 1]
+        nx, ny = loop[(i + 1) % len(loop)]
+        grid[y][x] = PIPES[frozenset([DIRS[(px - x, py - y)], DIRS[(nx - x, ny - y)]])]
+
+    sx, sy = rng.choice(loop)
+    grid[sy][sx] = "S"
+
+    # The solvers look in every direction from S, so clear junk next to it that might point at it. Loop tiles next
+    # to S only point at it when they are its neighbours along the loop.
+    in_loop = set(loop)
+    for dx, dy in DIRS:
+        if (sx + dx, sy + dy) not in in_loop:
+            grid[sy + dy][sx + dx] = "."
+
+    for row in grid:
+        yield "".join(row)
@@ -8,11 +8,6 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-# lines = read_file("data/example")
-# lines = read_file("data/example2")
-lines = read_file("data/input")
-
-
 class Dir(Enum):
     North = (0, -1)
     East = (1, 0)
@@ -101,9 +96,12 @@ class PipeMap:
 # S is the starting position of the animal; there is a pipe on this tile, but your sketch doesn't show what shape the pipe has.
 
 # The pipe that contains the animal is one large, continuous loop.
-m = PipeMap(lines)
-x, y = m.get_start_pos()
-ds = m.count_distances(x, y)
-result = np.max(ds)
-print(ds)
-print(result)
+def run(path: str = "data/input") -> int:
+    m = PipeMap(read_file(path))
+    x, y = m.get_start_pos()
+    ds = m.count_distances(x, y)
+    return np.max(ds)
+
+
+if __name__ == "__main__":
+    print(run())
@@ -1,8 +1,17 @@
+from collections import deque
 from enum import Enum
-from queue import Empty, Queue
+from pathlib import Path
 from typing import Generator
+import sys
 import numpy as np
 
+if __name__ == "__main__":
+    # Run as a script from the day directory. The flood fill shared with day 18 is in the aoc package one level
+    # up; importers (python -m aoc bench) already have it on their path.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.grid import flood  # noqa: E402
+
 
 def print_enclosing(data: np.array, distances: np.array):
     result = ""
@@ -34,9 +43,6 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-lines = read_file("data/input")
-
-
 class Dir(Enum):
     North = (0, -1)
     East = (1, 0)
@@ -54,6 +60,17 @@ SYMBOL_TO_POSSIBLE_DIRS = {
     "F": [Dir.South, Dir.East],
 }
 
+OPPOSITE = {Dir.North: Dir.South, Dir.East: Dir.West, Dir.South: Dir.North, Dir.West: Dir.East}
+
+# (pipe, (dx, dy) moving into it) -> (dx, dy) moving out of it
+TURNS = {
+    (c, d.value): next(o.value for o in dirs if o != OPPOSITE[d])
+    for c, dirs in SYMBOL_TO_POSSIBLE_DIRS.items()
+    if c != "S"
+    for d in Dir
+    if OPPOSITE[d] in dirs
+}
+
 
 class PipeMap:
     data: np.array
@@ -70,9 +87,8 @@ class PipeMap:
         self.data = np.array([list(line.strip()) for line in data])
 
     def start_pos(self):
-        for y, x in np.ndindex(self.data.shape):
-            if self.data[y, x] == "S":
-                return (x, y)
+        y, x = np.argwhere(self.data == "S")[0]
+        return (int(x), int(y))
 
     def expand(self):
         d = np.insert(self.data, np.arange(2, self.width - 1), ".", axis=1)
@@ -113,33 +129,63 @@ class PipeMap:
             case _:
                 return False
 
+    def loop_vertices(self) -> tuple[list[tuple[int, int]], int]:
+        # Walk the loop once from S. Returns its corners in walking order and its length in tiles.
+        x0, y0 = self.start_pos()
+
+        def leads_back(direction: Dir) -> bool:
+            dx, dy = direction.value
+            x, y = x0 + dx, y0 + dy
+            return 0 <= x < self.width and 0 <= y < self.height and self.connects(direction, self.get(x, y))
+
+        first_step = step = next(d for d in SYMBOL_TO_POSSIBLE_DIRS["S"] if leads_back(d)).value
+
+        vertices = []
+        x, y = x0, y0
+        length = 0
+        while True:
+            x, y = x + step[0], y + step[1]
+            length += 1
+
+            c = self.get(x, y)
+            if c == "S":
+                break
+
+            next_step = TURNS[c, step]
+            if next_step != step:
+                vertices.append((x, y))
+            step = next_step
+
+        # S is a corner too, unless the loop runs straight through it.
+        if step != first_step:
+            vertices.append((x0, y0))
+
+        return vertices, length
+
     def compute_loop_distances(self, x0: int, y0: int):
         distances = np.zeros(self.data.shape, dtype=int)
 
-        q = Queue()
-        q.put((x0, y0, 0))
-        try:
-            while p := q.get(block=False):
-                px, py, distance = p
-                c = self.get(px, py)
-                if not (potential_connectors := SYMBOL_TO_POSSIBLE_DIRS.get(c, None)):
-                    continue
+        q = deque([(x0, y0, 0)])
+        while q:
+            px, py, distance = q.popleft()
+            c = self.get(px, py)
+            if not (potential_connectors := SYMBOL_TO_POSSIBLE_DIRS.get(c, None)):
+                continue
 
-                for direction in potential_connectors:
-                    x, y = direction.value
-                    x += px
-                    y += py
+            for direction in potential_connectors:
+                x, y = direction.value
+                x += px
+                y += py
 
-                    if distances[y, x] > 0 and distances[y, x] <= distance + 1:
-                        continue
+                if distances[y, x] > 0 and distances[y, x] <= distance + 1:
+                    continue
 
-                    c = self.get(x, y)
-                    if self.connects(direction, c):
-                        q.put((x, y, distance + 1))
-                        distances[y, x] = distance + 1
+                c = self.get(x, y)
+                if self.connects(direction, c):
+                    q.append((x, y, distance + 1))
+                    distances[y, x] = distance + 1
 
-        except Empty:
-            return distances
+        return distances
 
 
 def stitch_horizontal(data: np.array, x: int, y: int):
@@ -155,40 +201,8 @@ def stitch_vertical(data: np.array, x: int, y: int):
 
 
 def flood_fill(data: np.array, loop_distances: np.array, x: int, y: int):
-    width = data.shape[1]
-    height = data.shape[0]
-
-    def in_loop(x: int, y: int) -> bool:
-        return loop_distances[y, x] > 0 or data[y, x] == "S"
-
-    def inside_bounds(x: int, y: int) -> bool:
-        return x >= 0 and x < width and y >= 0 and y < height
-
-    reached_edge = False
-    visited: set[tuple[int, int]] = set()
-    q = Queue()
-    q.put((x, y))
-    try:
-        while p := q.get(block=False):
-            if p in visited:
-                continue
-
-            px, py = p
-            visited.add((px, py))
-
-            if px == 0 or py == 0 or px == width - 1 or py == height - 1:
-                reached_edge = True
-
-            for direction in Dir:
-                dx, dy = direction.value
-                dx += px
-                dy += py
-                if (dx, dy) in visited or not inside_bounds(dx, dy) or in_loop(dx, dy):
-                    continue
-
-                q.put((dx, dy))
-    except Empty:
-        return visited, reached_edge
+    in_loop = (loop_distances > 0) | (data == "S")
+    return flood(~in_loop, x, y)
 
 
 def flood_fill_pos_generator(m: PipeMap, distances: np.array) -> Generator[tuple[int, int], None, None]:
@@ -197,8 +211,8 @@ def flood_fill_pos_generator(m: PipeMap, distances: np.array) -> Generator[tuple
             yield (x, y)
 
 
-def solve():
-    pipe_map = PipeMap(lines)
+def run(path: str = "data/input") -> int:
+    pipe_map = PipeMap(read_file(path))
 
     # Add extra positions between all tiles to handle the "travel-between-tiles" rule.
     pipe_map.expand()
@@ -212,17 +226,22 @@ def solve():
         x, y = start_pos
         positions, reached_edge = flood_fill(pipe_map.data, ds, x, y)
 
-        if len(positions) == 0:
-            break
-
-        c = "0" if reached_edge else "I"
-        for x, y in positions:
-            pipe_map.data[y, x] = c
+        pipe_map.data[positions == 1] = "0" if reached_edge else "I"
 
     # Remove the extra positions between tiles added earlier by expand.
     pipe_map.contract()
-    result = (pipe_map.data.flatten() == "I").sum()
-    print(result)
+    return (pipe_map.data.flatten() == "I").sum()
+
+
+def run_area(path: str = "data/input") -> int:
+    vertices, length = PipeMap(read_file(path)).loop_vertices()
+
+    # Shoelace formula for the area enclosed by the tile centres on the loop, then Pick's theorem
+    # (area = interior + boundary / 2 - 1) for the tiles strictly inside it.
+    twice_area = abs(sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(vertices, vertices[1:] + vertices[:1])))
+
+    return (twice_area - length) // 2 + 1
 
 
-solve()
+if __name__ == "__main__":
+    print(run())
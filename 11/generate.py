@@ -0,0 +1,20 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled_side
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of pixels, a 140 x 140 image per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(140, scale)
+
+    empty_rows = set(rng.sample(range(side), side // 14))
+    empty_cols = set(rng.sample(range(side), side // 14))
+
+    for y in range(side):
+        if y in empty_rows:
+            yield "." * side
+            continue
+
+        yield "".join("#" if x not in empty_cols and rng.random() < 0.02 else "." for x in range(side))
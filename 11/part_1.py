@@ -25,13 +25,18 @@ def tile_distance(g1: tuple[int, int], g2: tuple[int, int]) -> int:
     return abs(g1[0] - g2[0]) + abs(g1[1] - g2[1])
 
 
-lines = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
 
-universe = np.array(list(map(parse_line, lines)))
-universe = expand_universe(universe)
-rows, cols = np.where(universe == 1)
+    universe = np.array(list(map(parse_line, lines)))
+    universe = expand_universe(universe)
+    rows, cols = np.where(universe == 1)
 
-galaxies = np.column_stack((rows, cols)).tolist()
-pairs = combinations(galaxies, 2)
-distances = [tile_distance(g1, g2) for g1, g2 in pairs]
-print(sum(distances))
+    galaxies = np.column_stack((rows, cols)).tolist()
+    pairs = combinations(galaxies, 2)
+    distances = [tile_distance(g1, g2) for g1, g2 in pairs]
+    return sum(distances)
+
+
+if __name__ == "__main__":
+    print(run())
@@ -25,7 +25,7 @@ def get_expanded_galaxies(u: np.ndarray) -> list[list[int]]:
     empty_cols = np.where(~u.any(axis=0))[0]
     empty_rows = np.where(~u.any(axis=1))[0]
 
-    rows, cols = np.where(universe == 1)
+    rows, cols = np.where(u == 1)
     galaxies = np.column_stack((rows, cols)).tolist()
 
     expand_empty_space(empty_rows, galaxies, 0)
@@ -40,11 +40,16 @@ def tile_distance(g1: tuple[int, int], g2: tuple[int, int]) -> int:
     return abs(g1[0] - g2[0]) + abs(g1[1] - g2[1])
 
 
-lines = read_file("data/input")
-universe = np.array(list(map(parse_line, lines)))
-galaxies = get_expanded_galaxies(universe)
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    universe = np.array(list(map(parse_line, lines)))
+    galaxies = get_expanded_galaxies(universe)
 
-pairs = combinations(galaxies, 2)
-distances = [tile_distance(g1, g2) for g1, g2 in pairs]
+    pairs = combinations(galaxies, 2)
+    distances = [tile_distance(g1, g2) for g1, g2 in pairs]
 
-print(sum(distances))
+    return sum(distances)
+
+
+if __name__ == "__main__":
+    print(run())
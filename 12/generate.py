@@ -0,0 +1,24 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of rows, 1000 per unit."""
+    rng = random.Random(seed)
+
+    for _ in range(scaled(1000, scale)):
+        groups = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        while sum(groups) + len(groups) - 1 > 20:
+            groups.pop()
+
+        # Lay out a valid row for the groups, then hide part of it behind question marks.
+        gaps = [0] + [1] * (len(groups) - 1) + [0]
+        for _ in range(rng.randint(0, 20 - sum(groups) - sum(gaps))):
+            gaps[rng.randrange(len(gaps))] += 1
+
+        row = "".join("." * gap + "#" * size for gap, size in zip(gaps, groups)) + "." * gaps[-1]
+        springs = "".join("?" if rng.random() < 0.5 else c for c in row)
+
+        yield f"{springs} {','.join(map(str, groups))}"
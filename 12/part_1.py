@@ -9,10 +9,6 @@ def read_file(path: str) -> list[str]:
         return [line.strip() for line in f.readlines()]
 
 
-# lines = read_file("data/example")
-lines = read_file("data/input")
-
-
 def find_consec_overlapping(s: str, size: int, indent: int = 0) -> list[int]:
     indent_str = "  " * indent
     # print(f"{indent_str}Finding {size} in {s}")
@@ -110,23 +106,31 @@ def solve(current: str, remaining: str, groups: list[int], original_row: str, or
     return total_arrangements
 
 
-total_arrangements = 0
-for line in lines:
-    # line = "??????????#?#???#?? 3,10"
-    row, groups = line.split(" ")
-    groups = [int(x) for x in groups.split(",")]
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    THE_SOLUTIONS.clear()
+
+    total_arrangements = 0
+    for line in lines:
+        # line = "??????????#?#???#?? 3,10"
+        row, groups = line.split(" ")
+        groups = [int(x) for x in groups.split(",")]
 
-    # print("--------------------------")
-    # print(f"row: {row} ({groups})")
+        # print("--------------------------")
+        # print(f"row: {row} ({groups})")
+
+        total_arrangements += solve("", row, groups, row, groups)
+        # print(total_arrangements)
+        # print(row)
+        # for s in THE_SOLUTIONS:
+        #     print(" ".join([x for x in s]), len(s))
+        # exit(0)
+
+    return total_arrangements
 
-    total_arrangements += solve("", row, groups, row, groups)
-    # print(total_arrangements)
-    # print(row)
-    # for s in THE_SOLUTIONS:
-    #     print(" ".join([x for x in s]), len(s))
-    # exit(0)
 
-print(total_arrangements)
+if __name__ == "__main__":
+    print(run())
 
 
 # ?.?#.???#?????? [1, 9]
@@ -1,5 +1,4 @@
 import re
-import time
 from typing import Generator
 
 
@@ -8,9 +7,6 @@ def read_file(path: str) -> list[str]:
         return [line.strip() for line in f.readlines()]
 
 
-lines = read_file("data/input")
-
-
 def find_consec_overlapping(s: str, size: int, indent: int = 0) -> Generator[int, None, None]:
     i = 0
     first_index = s.find("#")
@@ -100,8 +96,8 @@ cached_states = {}
 known_dead_ends = {}
 
 
-def run():
-    start = time.time()
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
     total_arrangements = 0
     for line in lines:
         row, groups = line.split(" ")
@@ -115,7 +111,8 @@ def run():
         arrangements = solve(current="", remaining=row, groups=groups)
         total_arrangements += arrangements
 
-    print(f"{total_arrangements} in {time.time() - start} seconds")
+    return total_arrangements
 
 
-run()
+if __name__ == "__main__":
+    print(run())
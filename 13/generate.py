@@ -0,0 +1,66 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+
+def transpose(xs: list[str]) -> list[str]:
+    return list(map("".join, zip(*xs)))
+
+
+def reflections(xs: list[str], mismatches: int) -> list[int]:
+    result = []
+    for i in range(1, len(xs)):
+        pairs = zip(reversed(xs[:i]), xs[i:])
+        if sum(a != b for top, bottom in pairs for a, b in zip(top, bottom)) == mismatches:
+            result.append(i)
+
+    return result
+
+
+def mirror(xs: list[str], line: int) -> list[str]:
+    xs = list(xs)
+    for k in range(min(line, len(xs) - line)):
+        xs[line + k] = xs[line - 1 - k]
+
+    return xs
+
+
+def pattern(rng: random.Random) -> list[str]:
+    while True:
+        height = rng.randrange(7, 18, 2)
+        width = rng.randrange(5, 18, 2)
+        rows = ["".join(rng.choice("#.") for _ in range(width)) for _ in range(height)]
+
+        # A clean reflection between rows for part 1, and a reflection between columns with a single smudge for
+        # part 2. The smudge goes on a row the row reflection leaves unmatched, so it doesn't break part 1.
+        row_line = rng.choice([i for i in range(2, height - 1) if 2 * i != height])
+        col_line = rng.randint(1, width - 1)
+
+        rows = transpose(mirror(transpose(rows), col_line))
+        rows = mirror(rows, row_line)
+
+        unmatched = [y for y in range(height) if y < 2 * row_line - height or y >= 2 * row_line]
+        y = rng.choice(unmatched)
+        x = rng.randrange(max(0, 2 * col_line - width), min(width, 2 * col_line))
+        rows[y] = rows[y][:x] + ("#" if rows[y][x] == "." else ".") + rows[y][x + 1 :]
+
+        # Random content can add reflections of its own, start over if it did.
+        columns = transpose(rows)
+        if (
+            reflections(rows, 0) == [row_line]
+            and reflections(columns, 0) == []
+            and reflections(rows, 1) == []
+            and reflections(columns, 1) == [col_line]
+        ):
+            return columns if rng.random() < 0.5 else rows
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of patterns, 100 per unit."""
+    rng = random.Random(seed)
+
+    for i in range(scaled(100, scale)):
+        if i > 0:
+            yield ""
+        yield from pattern(rng)
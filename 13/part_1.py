@@ -10,9 +10,6 @@ def transpose(xs: list[str]) -> list[str]:
     return list(map("".join, zip(*xs)))
 
 
-lines = read_file("data/input")
-
-
 def is_reflection(xs: list[str], left: int, right: int):
     while left >= 0 and right < len(xs):
         if xs[left] != xs[right]:
@@ -29,7 +26,8 @@ def find_reflection(xs: list[str]):
             return i
 
 
-def run():
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
     lines_above = 0
     lines_to_the_left = 0
     for rows in chunk_by_value(lines, ""):
@@ -41,7 +39,8 @@ def run():
         if found_col is not None:
             lines_to_the_left += found_col + 1
 
-    print(lines_to_the_left + 100 * lines_above)
+    return lines_to_the_left + 100 * lines_above
 
 
-run()
+if __name__ == "__main__":
+    print(run())
@@ -10,9 +10,6 @@ def transpose(xs: list[str]) -> list[str]:
     return list(map("".join, zip(*xs)))
 
 
-lines = read_file("data/input")
-
-
 def count_different(a: str, b: str) -> int:
     return sum(1 for x, y in zip(a, b) if x != y)
 
@@ -48,7 +45,8 @@ def find_reflection_place(xs: list[str]):
                 return i + 1
 
 
-def run():
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
     lines_above = 0
     lines_to_the_left = 0
     for rows in chunk_by_value(lines, ""):
@@ -62,7 +60,8 @@ def run():
         if found_col is not None:
             lines_to_the_left += found_col
 
-    print(lines_to_the_left + 100 * lines_above)
+    return lines_to_the_left + 100 * lines_above
 
 
-run()
+if __name__ == "__main__":
+    print(run())
@@ -0,0 +1,13 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled_side
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of tiles, a 100 x 100 platform per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(100, scale)
+
+    for _ in range(side):
+        yield "".join(rng.choices("O#.", weights=[0.2, 0.17, 0.63], k=side))
@@ -27,13 +27,6 @@ def parse_line(line: str):
     return result
 
 
-lines = read_file("data/input")
-# lines = read_file("data/example")
-lines = [parse_line(line) for line in lines]
-data = np.array(lines)
-print(data.shape)
-
-
 def round_rock_indices(data: np.ndarray):
     return np.argwhere(data == TileType.ROUND_ROCK.value)
 
@@ -52,7 +45,15 @@ def slide_north(data: np.ndarray):
 
         loads.append(rows - y)
 
-    print(sum(loads))
+    return sum(loads)
+
+
+def run(path: str = "data/input") -> int:
+    lines = [parse_line(line) for line in read_file(path)]
+    data = np.array(lines)
+
+    return slide_north(data)
 
 
-slide_north(data)
+if __name__ == "__main__":
+    print(run())
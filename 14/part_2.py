@@ -1,4 +1,3 @@
-import time
 import numpy as np
 from enum import Enum
 
@@ -129,11 +128,14 @@ def cycle(data: np.ndarray):
 seen_states: dict[str, int] = {}
 
 
-def run():
-    lines = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
     lines = [parse_line(line) for line in lines]
     data = np.array(lines)
 
+    id_map.clear()
+    seen_states.clear()
+
     set_stone_ids(data)
 
     target_cycles = 10**9
@@ -158,10 +160,8 @@ def run():
 
         seen_states[key] = n_cycles
 
-    print(sum(result))
+    return sum(result)
 
 
-start = time.time()
-run()
-end = time.time()
-print(f"Time: {end-start}s.")
+if __name__ == "__main__":
+    print(run())
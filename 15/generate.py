@@ -0,0 +1,19 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of steps, 4000 per unit. The sequence is a single line."""
+    rng = random.Random(seed)
+    labels = ["".join(rng.choices(LETTERS, k=rng.randint(2, 6))) for _ in range(scaled(500, scale))]
+
+    steps = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+
+    yield ",".join(steps)
@@ -3,12 +3,6 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-line = read_file("data/input")[0]
-# line = read_file("data/example")[0]
-data = line.split(",")
-print(data)
-
-
 def run_hash(x: str) -> int:
     value = 0
     for c in x:
@@ -20,4 +14,12 @@ def run_hash(x: str) -> int:
     return value
 
 
-print(sum([run_hash(x) for x in data]))
+def run(path: str = "data/input") -> int:
+    line = read_file(path)[0]
+    data = line.split(",")
+
+    return sum([run_hash(x) for x in data])
+
+
+if __name__ == "__main__":
+    print(run())
@@ -9,10 +9,6 @@ def read_file(path: str) -> list[str]:
         return f.readlines()
 
 
-line = read_file("data/input")[0]
-data = line.split(",")
-
-
 def run_hash(x: str) -> int:
     value = 0
     for c in x:
@@ -73,7 +69,10 @@ class State:
                 del self.boxes[h]
 
 
-def run():
+def run(path: str = "data/input") -> int:
+    line = read_file(path)[0]
+    data = line.split(",")
+
     s = State()
 
     for step in data:
@@ -86,7 +85,8 @@ def run():
             _, focal_length = value
             total_focusing_power += (box + 1) * (slot + 1) * focal_length
 
-    print(total_focusing_power)
+    return total_focusing_power
 
 
-run()
+if __name__ == "__main__":
+    print(run())
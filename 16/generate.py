@@ -0,0 +1,17 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled_side
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of tiles, a 110 x 110 contraption per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(110, scale)
+
+    for y in range(side):
+        row = rng.choices(".\\/-|", weights=[0.9, 0.025, 0.025, 0.025, 0.025], k=side)
+        if y == 0:
+            # Part 1 expects the beam to be turned or split by the very first tile.
+            row[0] = "\\"
+        yield "".join(row)
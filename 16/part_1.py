@@ -178,8 +178,8 @@ def get_starting_light(start_tile: TileType) -> tuple[int, int, Direction]:
             raise Exception("Invalid start tile")
 
 
-def run():
-    raw_data = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    raw_data = read_file(path)
     mapping = [
         (".", TileType.EMPTY),
         ("/", TileType.FORWARD_SLASH),
@@ -197,7 +197,8 @@ def run():
     while len(s.lights) > 0:
         s.step()
 
-    print(s.count_energized())
+    return s.count_energized()
 
 
-run()
+if __name__ == "__main__":
+    print(run())
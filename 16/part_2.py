@@ -218,8 +218,8 @@ def parse_input(raw_data: str) -> np.ndarray:
     return np.array(rows)
 
 
-def run():
-    raw_data = read_file("data/input")
+def run(path: str = "data/input") -> int:
+    raw_data = read_file(path)
     data = parse_input(raw_data)
 
     s = State(data)
@@ -236,7 +236,8 @@ def run():
             solutions.append(n_energized)
             s.reset()
 
-    print(max(solutions))
+    return max(solutions)
 
 
-run()
+if __name__ == "__main__":
+    print(run())
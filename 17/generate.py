@@ -0,0 +1,13 @@
+import random
+from typing import Iterator
+
+from aoc.gen import scaled_side
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """scale: number of blocks, a 141 x 141 city per unit."""
+    rng = random.Random(seed)
+    side = scaled_side(141, scale)
+
+    for _ in range(side):
+        yield "".join(rng.choices("123456789", k=side))
@@ -242,16 +242,18 @@ def heuristic(pos: Pos, target: Pos):
     return abs(tx - x) + abs(ty - y)
 
 
-lines = read_file("data/input")
-data = lines_to_2d_nparray(lines)
+def run(path: str = "data/input") -> int:
+    lines = read_file(path)
+    data = lines_to_2d_nparray(lines)
 
-h, w = data.shape
+    h, w = data.shape
 
-start_point = Pos(0, 0)
-end_point = Pos(w - 1, h - 1)
+    start_point = Pos(0, 0)
+    end_point = Pos(w - 1, h - 1)
 
-total_cost, best_path = a_star(data, heuristic, start_point, end_point)
+    total_cost, _ = a_star(data, heuristic, start_point, end_point)
+    return total_cost
 
 
-show_path(data, best_path)
-print(f"total cost: {total_cost}")
+if __name__ == "__main__":
+    print(f"total cost: {run()}")
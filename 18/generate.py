@@ -0,0 +1,56 @@
+import random
+from itertools import accumulate
+from typing import Iterator
+
+from aoc.gen import random_loop, scaled_side
+
+DIRECTIONS = {(1, 0): ("R", 0), (0, 1): ("D", 1), (-1, 0): ("L", 2), (0, -1): ("U", 3)}
+MAX_HEX_METERS = 0xFFFFF
+
+
+def sign(x: int) -> int:
+    return (x > 0) - (x < 0)
+
+
+def corners(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    result = []
+    for i, (x, y) in enumerate(loop):
+        px, py = loop[i - 1]
+        nx, ny = loop[(i + 1) % len(loop)]
+        if (x - px, y - py) != (nx - x, ny - y):
+            result.append((x, y))
+
+    return result
+
+
+def stretch(rng: random.Random, n: int, low: int, high: int) -> list[int]:
+    # Random, strictly increasing positions for the grid lines 0..n.
+    return list(accumulate([0] + [rng.randint(low, high) for _ in range(n)]))
+
+
+def generate(scale: float, seed: int = 0) -> Iterator[str]:
+    """
+    scale: number of corners in the dig plan, about 660 per unit.
+
+    The plan traces a random simple loop. The meters field is kept small, while the color field encodes moves of up
+    to a million meters. Both describe the same shape, with the grid lines spread out by different amounts.
+    """
+    rng = random.Random(seed)
+    side = scaled_side(40, scale)
+
+    loop = random_loop(rng, side, side, fill=0.6)
+    # Start on the top-left corner, which is always convex with the inside down and to the right.
+    start = loop.index(min(loop, key=lambda p: (p[1], p[0])))
+    points = corners(loop[start:] + loop[:start])
+
+    longest = max(abs(x1 - x0) + abs(y1 - y0) for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))
+    meters_x, meters_y = stretch(rng, 2 * side, 2, 4), stretch(rng, 2 * side, 2, 4)
+    hex_x = stretch(rng, 2 * side, 1, MAX_HEX_METERS // longest)
+    hex_y = stretch(rng, 2 * side, 1, MAX_HEX_METERS // longest)
+
+    for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+        direction, hex_direction = DIRECTIONS[(sign(x1 - x0), sign(y1 - y0))]
+        meters = abs(meters_x[x1] - meters_x[x0]) + abs(meters_y[y1] - meters_y[y0])
+        hex_meters = abs(hex_x[x1] - hex_x[x0]) + abs(hex_y[y1] - hex_y[y0])
+
+        yield f"{direction} {meters} (#{hex_meters:05x}{hex_direction})"
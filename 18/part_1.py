@@ -1,9 +1,17 @@
 from dataclasses import dataclass
 from enum import Enum
-from queue import Empty, Queue
+from pathlib import Path
+import sys
 
 import numpy as np
 
+if __name__ == "__main__":
+    # Run as a script from the day directory. The flood fill shared with day 10 is in the aoc package one level
+    # up; importers (python -m aoc bench) already have it on their path.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aoc.grid import flood  # noqa: E402
+
 
 def read_file(path: str) -> list[str]:
     with open(path, "r") as f:
@@ -23,10 +31,6 @@ class Instruction:
     meters: int
 
 
-lines = read_file("data/input")
-# lines = read_file("data/example")
-
-
 def parse_direction(x: str) -> Direction:
     match x:
         case "U":
@@ -39,50 +43,22 @@ def parse_direction(x: str) -> Direction:
             return Direction.WEST
 
 
-instructions = []
-for line in lines:
-    d, m, c = line.split(" ")
+def parse_instructions(lines: list[str]) -> list[Instruction]:
+    instructions = []
+    for line in lines:
+        d, m, c = line.split(" ")
 
-    meters = int(m)
-    instructions.append(Instruction(parse_direction(d), meters))
-
-side_length = 1000
+        meters = int(m)
+        instructions.append(Instruction(parse_direction(d), meters))
 
+    return instructions
 
-def flood_fill(data: np.array, x: int, y: int):
-    height, width = data.shape
 
-    def in_loop(x: int, y: int) -> bool:
-        return data[y, x] == 1
-
-    def inside_bounds(x: int, y: int) -> bool:
-        return x >= 0 and x < width and y >= 0 and y < height
-
-    reached_edge = False
-    visited: set[tuple[int, int]] = set()
-    q = Queue()
-    q.put((x, y))
-    try:
-        while p := q.get(block=False):
-            if p in visited:
-                continue
-
-            px, py = p
-            visited.add((px, py))
-
-            if px == 0 or py == 0 or px == width - 1 or py == height - 1:
-                reached_edge = True
+side_length = 1000
 
-            for direction in Direction:
-                dx, dy = direction.value
-                dx += px
-                dy += py
-                if (dx, dy) in visited or not inside_bounds(dx, dy) or in_loop(dx, dy):
-                    continue
 
-                q.put((dx, dy))
-    except Empty:
-        return visited, reached_edge
+def flood_fill(data: np.array, x: int, y: int):
+    return flood(data != 1, x, y)
 
 
 class State:
@@ -131,30 +107,32 @@ class State:
         self.bottom_right = (max(x1, x), max(y1, y))
 
 
-s = State(side_length)
+def run(path: str = "data/input") -> int:
+    s = State(side_length)
 
-for instruction in instructions:
-    s.apply_instruction(instruction)
+    for instruction in parse_instructions(read_file(path)):
+        s.apply_instruction(instruction)
 
+    x0, y0 = s.contracted_zero
+    flood_fill_candidates = [
+        (x0 + 1, y0 + 1),
+        (x0 - 1, y0 - 1),
+        (x0 + 1, y0 - 1),
+        (x0 - 1, y0 + 1),
+    ]
 
-print(s.contracted_grid)
+    contracted_grid = s.contracted_grid
+    edges = contracted_grid.sum()
 
-x0, y0 = s.contracted_zero
-flood_fill_candidates = [
-    (x0 + 1, y0 + 1),
-    (x0 - 1, y0 - 1),
-    (x0 + 1, y0 - 1),
-    (x0 - 1, y0 + 1),
-]
+    for candidate in flood_fill_candidates:
+        visited, reached_edge = flood_fill(s.contracted_grid, *candidate)
+        if not reached_edge and visited.sum() > 1:
+            filled_tiles = int(visited.sum())
+            return edges + filled_tiles
 
-contracted_grid = s.contracted_grid
-edges = contracted_grid.sum()
 
-for candidate in flood_fill_candidates:
-    visited, reached_edge = flood_fill(s.contracted_grid, *candidate)
-    if not reached_edge and len(visited) > 1:
-        filled_tiles = len(visited)
-        print(f"{edges} edges + {filled_tiles} filled tiles = {edges + filled_tiles}")
+if __name__ == "__main__":
+    print(run())
 
 # x0, y0 = top_left
 # x1, y1 = bottom_right
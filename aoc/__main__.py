@@ -0,0 +1,23 @@
+import argparse
+import sys
+
+from aoc import bench, gen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench.add_arguments(commands.add_parser("bench", help="time solvers against their data files"))
+    gen.add_arguments(commands.add_parser("gen", help="write a generated input for a day"))
+
+    args = parser.parse_args()
+    match args.command:
+        case "bench":
+            return bench.main(args)
+        case "gen":
+            return gen.main(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from aoc import days, gen
+
+
+@dataclass
+class Case:
+    day: str
+    part: int
+    input: str
+    variant: str = ""
+
+    @property
+    def key(self) -> str:
+        solver = f"{self.part}:{self.variant}" if self.variant else str(self.part)
+        return f"{self.day}/{solver}/{self.input}"
+
+
+@dataclass
+class Result:
+    case: Case
+    status: str
+    size_bytes: Optional[int] = None
+    answer: Optional[str] = None
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    peak_rss_kb: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def wall_median(self) -> Optional[float]:
+        return statistics.median(self.wall) if self.wall else None
+
+    @property
+    def cpu_median(self) -> Optional[float]:
+        return statistics.median(self.cpu) if self.cpu else None
+
+    def to_json(self) -> dict:
+        data = asdict(self)
+        data.update(data.pop("case"))
+        data["key"] = self.case.key
+        data["wall_median"] = self.wall_median
+        data["cpu_median"] = self.cpu_median
+        return data
+
+
+def peak_rss_kb() -> int:
+    # The largest of this process and any process pool worker it has waited for.
+    rss = max(resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+    # Linux reports kilobytes, macOS reports bytes.
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def cpu_time() -> float:
+    # Includes the workers of process pools the solver started and shut down.
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def measure(case: Case, path: str, warmup: int, repeat: int, conn) -> None:
+    try:
+        solve = days.load_solver(case.day, case.part, case.variant)
+        # Process pools started by the solver unpickle the day's helpers (util.py) by module name.
+        sys.path.insert(0, str(days.day_dirs()[case.day]))
+
+        wall = []
+        cpu = []
+        # Solvers print debugging output, keep it out of the report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(warmup):
+                solve(path)
+
+            for _ in range(repeat):
+                w0, c0 = time.perf_counter(), cpu_time()
+                answer = solve(path)
+                wall.append(time.perf_counter() - w0)
+                cpu.append(cpu_time() - c0)
+
+        conn.send(("ok", str(answer), wall, cpu, peak_rss_kb(), None))
+    except BaseException as e:
+        conn.send(("error", None, [], [], peak_rss_kb(), f"{type(e).__name__}: {e}"))
+
+
+def run_case(case: Case, path: Path, warmup: int, repeat: int, timeout: float) -> Result:
+    # A fresh interpreter per case keeps peak RSS and module state (caches, globals) per day and part.
+    ctx = multiprocessing.get_context("spawn")
+    recv, send = ctx.Pipe(duplex=False)
+    p = ctx.Process(target=measure, args=(case, str(path), warmup, repeat, send))
+    p.start()
+    send.close()
+
+    size = path.stat().st_size
+
+    if not recv.poll(timeout):
+        p.terminate()
+        p.join()
+        return Result(case, status="timeout", size_bytes=size)
+
+    try:
+        status, answer, wall, cpu, rss, error = recv.recv()
+    except EOFError:
+        p.join()
+        return Result(case, status="error", size_bytes=size, error=f"exit code {p.exitcode}")
+
+    p.join()
+    return Result(case, status, size, answer, wall, cpu, rss, error)
+
+
+def scaling_exponent(results: list[Result]) -> Optional[float]:
+    # Least squares slope of log(wall time) against log(input size): 1 is linear, 2 quadratic.
+    points = [(math.log(r.size_bytes), math.log(r.wall_median)) for r in results if r.status == "ok" and r.wall_median]
+    if len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def compare(results: list[Result], baseline: dict, threshold: float, min_delta: float) -> list[str]:
+    base_by_key = {r["key"]: r for r in baseline["results"]}
+
+    problems = []
+    for result in results:
+        base = base_by_key.get(result.case.key)
+        if base is None or base["status"] != "ok":
+            continue
+
+        if result.status != "ok":
+            problems.append(f"{result.case.key}: {result.status} (baseline ok)")
+            continue
+
+        if result.answer != base["answer"]:
+            problems.append(f"{result.case.key}: answer {result.answer} != baseline {base['answer']}")
+
+        before, after = base["wall_median"], result.wall_median
+        if after - before > min_delta and after > before * (1 + threshold):
+            change = f"+{after / before - 1:.0%}"
+            problems.append(f"{result.case.key}: wall {after:.4f}s vs baseline {before:.4f}s ({change})")
+
+    return problems
+
+
+def format_row(result: Result, baseline: Optional[dict]) -> str:
+    key = result.case.key
+    if result.status != "ok":
+        return f"{key:<28} {result.status:>10}  {result.error or ''}"
+
+    delta = ""
+    if baseline is not None and (base := baseline.get(key)) and base["status"] == "ok":
+        delta = f"{result.wall_median / base['wall_median'] - 1:+.0%}"
+
+    return (
+        f"{key:<28} {result.wall_median:>10.4f} {result.cpu_median:>10.4f} "
+        f"{result.peak_rss_kb / 1024:>9.1f} {delta:>7}  {result.answer}"
+    )
+
+
+def collect_cases(args, generated_dir: Path) -> list[tuple[Case, Path]]:
+    all_days = days.day_dirs()
+    cases = []
+    for day in args.days or all_days.keys():
+        day = day.zfill(2)
+        if day not in all_days:
+            raise SystemExit(f"Unknown day: {day}")
+
+        if args.scales:
+            if not (all_days[day] / "generate.py").exists():
+                continue
+
+            paths = [
+                gen.write(day, scale, args.seed, generated_dir / day / f"x{scale:g}") for scale in args.scales
+            ]
+        else:
+            paths = days.inputs(day, args.inputs)
+
+        for part in days.parts(day):
+            if args.parts and part not in args.parts:
+                continue
+
+            for variant in ["", *days.variants(day, part)]:
+                if args.variants and (variant or "run") not in args.variants:
+                    continue
+
+                cases.extend((Case(day, part, path.name, variant), path) for path in paths)
+
+    return cases
+
+
+def main(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    baseline_by_key = {r["key"]: r for r in baseline["results"]} if baseline is not None else None
+
+    print(f"{'day/part/input':<28} {'wall (s)':>10} {'cpu (s)':>10} {'rss (MB)':>9} {'delta':>7}  answer")
+
+    results = []
+    with tempfile.TemporaryDirectory() as generated_dir:
+        for case, path in collect_cases(args, Path(generated_dir)):
+            result = run_case(case, path, args.warmup, args.repeat, args.timeout)
+            results.append(result)
+            print(format_row(result, baseline_by_key), flush=True)
+
+    if args.scales:
+        print()
+        series: dict[str, list[Result]] = {}
+        for result in results:
+            series.setdefault(result.case.key.rpartition("/")[0], []).append(result)
+
+        for solver, xs in series.items():
+            exponent = scaling_exponent(xs)
+            if exponent is None:
+                continue
+
+            flag = "  super-linear" if exponent > args.max_exponent else ""
+            sizes = " ".join(f"{r.size_bytes}B:{r.wall_median:.4f}s" for r in xs if r.status == "ok")
+            print(f"{solver} scales as size^{exponent:.2f}{flag}  ({sizes})")
+
+    if args.save:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "results": [r.to_json() for r in results],
+        }
+        Path(args.save).write_text(json.dumps(report, indent=2) + "\n")
+
+    if baseline is None:
+        return 0
+
+    problems = compare(results, baseline, args.threshold, args.min_delta)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+
+    return 1 if problems else 0
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument("days", nargs="*", help="days to run, e.g. 1 05 17 (default: all)")
+    parser.add_argument("-p", "--parts", nargs="+", type=int, default=[], help="parts to run (default: all)")
+    parser.add_argument(
+        "-i", "--inputs", nargs="+", default=["input", "example*"], help="glob patterns for files in NN/data/"
+    )
+    parser.add_argument(
+        "-v", "--variants", nargs="+", default=[], help="solvers to run: run, or <variant> for run_<variant>"
+    )
+    parser.add_argument(
+        "-s", "--scales", nargs="+", type=float, default=[], help="run on generated inputs of these scales instead"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    parser.add_argument("--max-exponent", type=float, default=1.2, help="flag scaling worse than size^x")
+    parser.add_argument("-w", "--warmup", type=int, default=1)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-t", "--timeout", type=float, default=300, help="seconds per day/part/input")
+    parser.add_argument("--save", metavar="JSON", help="write results as a baseline")
+    parser.add_argument("--baseline", metavar="JSON", help="diff against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative wall time slowdown to flag")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="ignore slowdowns below this many seconds")
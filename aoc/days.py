@@ -0,0 +1,61 @@
+import ast
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def day_dirs() -> dict[str, Path]:
+    return {p.name: p for p in sorted(ROOT.glob("[0-9][0-9]")) if any(p.glob("part_*.py"))}
+
+
+def parts(day: str) -> list[int]:
+    return sorted(int(p.stem.removeprefix("part_")) for p in day_dirs()[day].glob("part_*.py"))
+
+
+def inputs(day: str, patterns: list[str]) -> list[Path]:
+    data_dir = day_dirs()[day] / "data"
+
+    result: list[Path] = []
+    for pattern in patterns:
+        result.extend(p for p in sorted(data_dir.glob(pattern)) if p.is_file() and p not in result)
+
+    return result
+
+
+def load_module(day: str, name: str) -> ModuleType:
+    day_dir = day_dirs()[day]
+
+    # Days share helper module names (e.g. util.py), so each day gets a clean import of its own.
+    sys.modules.pop("util", None)
+    sys.path.insert(0, str(day_dir))
+    try:
+        spec = importlib.util.spec_from_file_location(f"day_{day}_{name}", day_dir / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        # Registered so that process pools can pickle the module's functions.
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(day_dir))
+
+    return module
+
+
+def variants(day: str, part: int) -> list[str]:
+    # Alternative solvers are top-level run_<variant>(path, ...) functions. Found without importing the module.
+    # Helpers that merely share the prefix (e.g. day 15's run_hash(x)) don't take a path first and are skipped.
+    tree = ast.parse((day_dirs()[day] / f"part_{part}.py").read_text())
+    names = [
+        node.name
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.args.args and node.args.args[0].arg == "path"
+    ]
+
+    return [name.removeprefix("run_") for name in names if name.startswith("run_")]
+
+
+def load_solver(day: str, part: int, variant: str = "") -> Callable[[str], object]:
+    return getattr(load_module(day, f"part_{part}"), f"run_{variant}" if variant else "run")
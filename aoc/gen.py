@@ -0,0 +1,142 @@
+import math
+import random
+from pathlib import Path
+from typing import Iterator
+
+from aoc import days
+
+Point = tuple[int, int]
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def scaled_side(base: int, scale: float) -> int:
+    # Grids grow in both directions, so the side grows with the square root of the scale.
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def random_tree(rng: random.Random, width: int, height: int, fill: float, holes: float) -> dict[Point, Point]:
+    # Randomized Prim over a width x height grid of cells, steering around a random fraction of blocked cells.
+    # Returns child -> parent.
+    blocked = {(x, y) for x in range(width) for y in range(height) if rng.random() < holes}
+    start = (rng.randrange(width), rng.randrange(height))
+    blocked.discard(start)
+
+    parents: dict[Point, Point] = {start: start}
+    frontier = [(start, n) for n in grid_neighbors(start, width, height)]
+    target = max(1, round(width * height * fill))
+
+    while frontier and len(parents) < target:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        parent, cell = frontier.pop()
+        if cell in parents or cell in blocked:
+            continue
+
+        parents[cell] = parent
+        frontier.extend((cell, n) for n in grid_neighbors(cell, width, height) if n not in parents)
+
+    return parents
+
+
+def grid_neighbors(cell: Point, width: int, height: int) -> Iterator[Point]:
+    x, y = cell
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        if 0 <= x + dx < width and 0 <= y + dy < height:
+            yield (x + dx, y + dy)
+
+
+def random_loop(rng: random.Random, width: int, height: int, fill: float, holes: float = 0.1) -> list[Point]:
+    """
+    A simple closed loop on a (2 * width) x (2 * height) grid, as the ordered list of tiles it passes through.
+
+    Every cell of a random tree becomes a 2x2 ring of tiles, and rings of cells joined by a tree edge are merged
+    into one. Since the cells form a tree the result is a single loop. Cells kept out of the tree but surrounded by
+    it end up enclosed by the loop.
+    """
+    links: dict[Point, set[Point]] = {}
+
+    def link(a: Point, b: Point):
+        links.setdefault(a, set()).add(b)
+        links.setdefault(b, set()).add(a)
+
+    def unlink(a: Point, b: Point):
+        links[a].discard(b)
+        links[b].discard(a)
+
+    parents = random_tree(rng, width, height, fill, holes)
+    for cx, cy in parents:
+        tl, tr, bl, br = (2 * cx, 2 * cy), (2 * cx + 1, 2 * cy), (2 * cx, 2 * cy + 1), (2 * cx + 1, 2 * cy + 1)
+        link(tl, tr)
+        link(tr, br)
+        link(br, bl)
+        link(bl, tl)
+
+    for child, parent in parents.items():
+        if child == parent:
+            continue
+
+        (ax, ay), (bx, by) = sorted([child, parent])
+        if ay == by:
+            # a is left of b
+            a_tr, a_br = (2 * ax + 1, 2 * ay), (2 * ax + 1, 2 * ay + 1)
+            b_tl, b_bl = (2 * bx, 2 * by), (2 * bx, 2 * by + 1)
+            unlink(a_tr, a_br)
+            unlink(b_tl, b_bl)
+            link(a_tr, b_tl)
+            link(a_br, b_bl)
+        else:
+            # a is above b
+            a_bl, a_br = (2 * ax, 2 * ay + 1), (2 * ax + 1, 2 * ay + 1)
+            b_tl, b_tr = (2 * bx, 2 * by), (2 * bx + 1, 2 * by)
+            unlink(a_bl, a_br)
+            unlink(b_tl, b_tr)
+            link(a_bl, b_tl)
+            link(a_br, b_tr)
+
+    start = min(links)
+    loop = [start]
+    prev, current = start, min(links[start])
+    while current != start:
+        loop.append(current)
+        prev, current = current, next(n for n in links[current] if n != prev)
+
+    return loop
+
+
+def load_generator(day: str):
+    return days.load_module(day, "generate").generate
+
+
+def write(day: str, scale: float, seed: int, path: Path) -> Path:
+    generate = load_generator(day)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for i, line in enumerate(generate(scale, seed)):
+            if i > 0:
+                f.write("\n")
+            f.write(line)
+
+    return path
+
+
+def main(args) -> int:
+    day = args.day.zfill(2)
+    if day not in days.day_dirs():
+        raise SystemExit(f"Unknown day: {day}")
+
+    path = Path(args.output or days.day_dirs()[day] / "data" / f"generated_x{args.scale:g}_s{args.seed}")
+    write(day, args.scale, args.seed, path)
+    print(path)
+
+    return 0
+
+
+def add_arguments(parser) -> None:
+    parser.add_argument("day")
+    parser.add_argument("-s", "--scale", type=float, default=1, help="size relative to the puzzle input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="default: NN/data/generated_x<scale>_s<seed>")
@@ -0,0 +1,51 @@
+import numpy as np
+
+# Frontiers smaller than this are expanded cell by cell: a numpy pass costs about as much as that many cells.
+SMALL_FRONTIER = 64
+
+
+def flood(passable: np.ndarray, x: int, y: int) -> tuple[np.ndarray, bool]:
+    """
+    4-connected flood fill over the passable cells of a grid, starting at (x, y), which is always included.
+
+    Returns the uint8 mask of visited cells and whether the fill touched the edge of the grid. The search expands a
+    frontier of flat indices one level at a time, on a copy of the grid with a blocked border so that neighbours
+    never wrap around a row. Wide frontiers are expanded with numpy, narrow ones (corridors) in plain Python over
+    bytes, both writing to the same visited buffer.
+    """
+    height, width = passable.shape
+    stride = width + 2
+
+    open_cells = np.zeros((height + 2, stride), dtype=np.uint8)
+    open_cells[1:-1, 1:-1] = passable
+    open_bytes = open_cells.tobytes()
+    open_cells = open_cells.ravel().view(bool)
+
+    visited_bytes = bytearray(len(open_bytes))
+    visited = np.frombuffer(visited_bytes, dtype=np.uint8)
+
+    start = (y + 1) * stride + x + 1
+    visited_bytes[start] = 1
+    frontier = [start]
+    offsets = np.array([1, -1, stride, -stride])
+    while len(frontier) > 0:
+        if len(frontier) < SMALL_FRONTIER:
+            neighbours = []
+            for cell in frontier:
+                for neighbour in (cell + 1, cell - 1, cell + stride, cell - stride):
+                    if open_bytes[neighbour] and not visited_bytes[neighbour]:
+                        visited_bytes[neighbour] = 1
+                        neighbours.append(neighbour)
+        else:
+            neighbours = (np.asarray(frontier)[:, None] + offsets).ravel()
+            neighbours = np.unique(neighbours[open_cells[neighbours] & (visited[neighbours] == 0)])
+            visited[neighbours] = 1
+            if len(neighbours) < SMALL_FRONTIER:
+                neighbours = neighbours.tolist()
+
+        frontier = neighbours
+
+    visited = visited.reshape(height + 2, stride)[1:-1, 1:-1]
+    reached_edge = bool(visited[0].any() or visited[-1].any() or visited[:, 0].any() or visited[:, -1].any())
+
+    return visited, reached_edge